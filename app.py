@@ -1,14 +1,20 @@
 """
 Ahab GUI - Secure web interface for Ahab infrastructure automation.
 """
+import json
 import logging
-import os
 import sys
+import threading
+import time
+import uuid
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request, session
+from functools import lru_cache
+import orjson
+from flask import Flask, Response, abort, current_app, render_template, jsonify, request, session
+from flask.json.provider import JSONProvider
 from flask_wtf.csrf import CSRFProtect, CSRFError
+from werkzeug.routing import BaseConverter
 from flask_socketio import SocketIO
-from flask_session import Session
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -24,6 +30,14 @@ logger = logging.getLogger(__name__)
 
 # Import configuration module (but don't create config yet)
 from config import create_config
+from commands.executor import CommandExecutor, get_system_status
+
+# The config manager lives in lib/, which is optional for the dashboard;
+# the OS endpoints report an error when it is missing
+try:
+    from lib.config_manager import AhabConfigManager
+except ImportError:
+    AhabConfigManager = None
 
 # Global config instance (created lazily)
 _config = None
@@ -42,223 +56,504 @@ def get_config():
     return _config
 
 
+def _create_config_manager(ahab_path):
+    """Create an AhabConfigManager, failing loudly if lib/ is unavailable."""
+    if AhabConfigManager is None:
+        raise RuntimeError("Config manager is not available (lib.config_manager missing)")
+    return AhabConfigManager(ahab_path)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson (serializes datetimes natively)."""
+    
+    options = orjson.OPT_NON_STR_KEYS
+    
+    @staticmethod
+    def _default(obj):
+        """Serialize types orjson does not handle natively."""
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj)
+        if hasattr(obj, '__html__'):
+            return str(obj.__html__())
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=self._default, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Build a JSON response without a bytes -> str -> bytes round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self._default, option=self.options)
+        return self._app.response_class(body, mimetype='application/json')
+
+
+def _wants_json():
+    """Check whether the client expects JSON (evaluated once per request)."""
+    # Cached on the request, like _request_json, not on g
+    wants_json = getattr(request, '_ahab_wants_json', None)
+    if wants_json is None:
+        wants_json = request.is_json or request.headers.get('Accept') == 'application/json'
+        request._ahab_wants_json = wants_json
+    return wants_json
+
+
+def _request_json(allow_empty=False):
+    """Parse the JSON object in the request body (once per request, with orjson).
+    
+    Skips Flask's content-type negotiation. An empty body is treated as {}
+    only when allow_empty is set; otherwise it, malformed JSON and any
+    non-object value abort with 400.
+    """
+    # Cached on the request itself: g can outlive a request when an app
+    # context is already pushed (as in tests)
+    data = getattr(request, '_ahab_json', None)
+    if data is None:
+        body = request.get_data(cache=True)
+        if not body and allow_empty:
+            return {}
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            abort(400)
+        if not isinstance(data, dict):
+            abort(400)
+        request._ahab_json = data
+    return data
+
+
+# (second, ISO timestamp) shared by status responses within the same second
+_now_cache = (0, '')
+
+
+def _now_iso():
+    """Get the current time as an ISO string, formatted at most once a second.
+    
+    Status endpoints are polled by every open page; second resolution is
+    all the 'last updated' display needs.
+    """
+    global _now_cache
+    second = int(time.time())
+    if _now_cache[0] != second:
+        _now_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_cache[1]
+
+
+# Security headers added to every response
+_SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Content-Security-Policy': "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"
+}
+_SECURITY_HEADERS_PROD = {
+    **_SECURITY_HEADERS,
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains'
+}
+
+
+# Error responses (constant, shared by every request)
+_CSRF_ERROR_JSON = {
+    'error': True,
+    'message': 'Security validation failed. Please refresh the page.',
+    'code': 'CSRF_ERROR'
+}
+_CSRF_ERROR_PAGE = {
+    'error_code': 'CSRF_ERROR',
+    'error_title': 'Security Validation Failed',
+    'error_message': 'Your session security token is invalid. This usually happens when your session expires.',
+    'recovery_actions': (
+        'Refresh the page to get a new security token',
+        'Clear your browser cookies and try again',
+        'Go back to the dashboard',
+        'Contact support if the problem persists'
+    )
+}
+
+_BAD_REQUEST_JSON = {
+    'error': True,
+    'message': 'Invalid request.',
+    'code': 'BAD_REQUEST'
+}
+_BAD_REQUEST_PAGE = {
+    'error_code': 'BAD_REQUEST',
+    'error_title': 'Invalid Request',
+    'error_message': 'The request you sent was not valid. This might be due to incorrect data or a malformed URL.',
+    'recovery_actions': (
+        'Check the URL for errors',
+        'Go back and try again',
+        'Return to the dashboard',
+        'Contact support if you need help'
+    )
+}
+
+_NOT_FOUND_JSON = {
+    'error': True,
+    'message': 'Resource not found.',
+    'code': 'NOT_FOUND'
+}
+
+_RATE_LIMIT_JSON = {
+    'error': True,
+    'message': 'Too many requests. Please wait a moment.',
+    'code': 'RATE_LIMIT'
+}
+_RATE_LIMIT_PAGE = {
+    'error_code': 'RATE_LIMIT',
+    'error_title': 'Too Many Requests',
+    'error_message': 'You\'ve made too many requests in a short time. Please wait a moment before trying again.',
+    'recovery_actions': (
+        'Wait 30 seconds and try again',
+        'Avoid clicking buttons multiple times',
+        'Return to the dashboard',
+        'Contact support if you need immediate assistance'
+    )
+}
+
+_SERVER_ERROR_JSON = {
+    'error': True,
+    'message': 'An error occurred. Please try again.',
+    'code': 'SERVER_ERROR'
+}
+
+_ERROR_TEMPLATES = (
+    'errors/400.html',
+    'errors/403.html',
+    'errors/404.html',
+    'errors/429.html',
+    'errors/500.html'
+)
+
+
+# Command whitelist, serialized once (it never changes at runtime)
+_WHITELIST_JSON = json.dumps({
+    'commands': [
+        'install',
+        'test',
+        'status',
+        'clean',
+        'ssh',
+        'verify-install',
+        'network-switches',
+        'network-switches-version',
+        'network-switches-test'
+    ],
+    'services': [
+        'apache',
+        'mysql',
+        'php'
+    ],
+    'network': [
+        'switches'
+    ]
+}).encode('utf-8')
+
+# Response formats offered by /api/execute, in order of preference
+_EXECUTE_MIMETYPES = ('application/json', 'text/plain')
+
+
+# Valid path/body parameters for service and network endpoints
+_VALID_SERVICES = frozenset(('apache', 'mysql', 'php'))
+_STATUS_SERVICES = _VALID_SERVICES | {'nginx'}
+_VALID_ENVS = frozenset(('dev', 'prod'))
+
+# Service action -> (progress verb, past tense) for logs and responses
+_SERVICE_ACTIONS = {
+    'install': ('Installing', 'installed'),
+    'restart': ('Restarting', 'restarted'),
+    'remove': ('Removing', 'removed'),
+}
+
+# Network switch action -> (make target, log label)
+_SWITCH_ACTIONS = {
+    'version': ('network-switches-version', 'version'),
+    'test': ('network-switches-test', 'test'),
+    'manage': ('network-switches', 'management'),
+}
+
+# Network switch make commands, keyed by (action, environment)
+_SWITCH_COMMANDS = {
+    (action, env): f'{target} ENV={env}'
+    for action, (target, _) in _SWITCH_ACTIONS.items()
+    for env in _VALID_ENVS
+}
+
+
+def _choice_converter(choices):
+    """Create a URL converter that only matches one of the given values.
+    
+    Anything else fails at routing time with a 404, before reaching a view.
+    """
+    class ChoiceConverter(BaseConverter):
+        regex = '|'.join(sorted(choices))
+    
+    return ChoiceConverter
+
+
+# URL converters for the service and network switch routes
+_URL_CONVERTERS = {
+    'service': _choice_converter(_VALID_SERVICES),
+    'service_action': _choice_converter(_SERVICE_ACTIONS),
+    'switch_action': _choice_converter(_SWITCH_ACTIONS),
+}
+
+
+# Workstation status display fields, keyed by (installed, running)
+_WORKSTATION_RUNNING = {
+    'status_value': 'Running',
+    'status_type': 'success',
+    'description': 'Workstation VM is operational'
+}
+_WORKSTATION_STATES = {
+    (True, True): _WORKSTATION_RUNNING,
+    (False, True): _WORKSTATION_RUNNING,
+    (True, False): {
+        'status_value': 'Stopped',
+        'status_type': 'warning',
+        'description': 'Workstation VM exists but is stopped'
+    },
+    (False, False): {
+        'status_value': 'Not Installed',
+        'status_type': 'info',
+        'description': 'No workstation VM found'
+    }
+}
+
+# Service status display fields, keyed by (service, installed)
+_SERVICE_STATES = {
+    (name, installed): {
+        'status_value': 'Running' if installed else 'Not Installed',
+        'status_type': 'success' if installed else 'info',
+        'description': f"{name.title()} service is {'operational' if installed else 'not installed'}"
+    }
+    for name in _STATUS_SERVICES
+    for installed in (True, False)
+}
+
+
+# Navigation items with progressive disclosure
+# Items are shown/hidden based on system state (to be implemented)
+_NAV_TEMPLATE = (
+    {'label': 'Home', 'url': '/', 'is_available': True, 'icon': 'home'},
+    {'label': 'Workstation', 'url': '/workstation', 'is_available': True, 'icon': 'server'},
+    {'label': 'Services', 'url': '/services', 'is_available': True, 'icon': 'grid'},
+    {'label': 'Network', 'url': '/network', 'is_available': True, 'icon': 'network'},
+    {'label': 'Tests', 'url': '/tests', 'is_available': True, 'icon': 'check'},
+    {'label': 'Help', 'url': '/help', 'is_available': True, 'icon': 'help'},
+)
+
+
+def _build_nav(current):
+    """Build navigation items with the item at index `current` marked."""
+    return tuple(
+        {**item, 'is_current': index == current}
+        for index, item in enumerate(_NAV_TEMPLATE)
+    )
+
+
+# Page endpoint -> navigation with its section marked current; the routing
+# match already identified the page, so no path parsing is needed per request
+_NAV_BY_ENDPOINT = {
+    endpoint: _build_nav(index)
+    for endpoint, index in (
+        ('index', 0),
+        ('workstation', 1),
+        ('services', 2),
+        ('network', 3),
+        ('network_switches', 3),
+        ('tests', 4),
+        ('help_page', 5),
+    )
+}
+_NAV_NO_CURRENT = _build_nav(None)
+
+
+def _nav_for_endpoint(endpoint):
+    """Get navigation items for the matched endpoint (None for errors)."""
+    return _NAV_BY_ENDPOINT.get(endpoint, _NAV_NO_CURRENT)
+
+
+@lru_cache(maxsize=512)
+def _build_breadcrumbs(path):
+    """Build breadcrumbs for a path (cached, they depend only on the path)."""
+    # Parse path to generate breadcrumbs
+    parts = [p for p in path.split('/') if p]
+    
+    # The dashboard (and anything that collapses to it) has no trail
+    if not parts:
+        return ()
+    
+    # Always start with Home
+    breadcrumbs = [{'label': 'Home', 'url': '/', 'is_current': False}]
+    
+    last = len(parts) - 1
+    for i, part in enumerate(parts):
+        breadcrumbs.append({
+            # Capitalize and format label
+            'label': part.replace('-', ' ').title(),
+            'url': '/' + '/'.join(parts[:i + 1]),
+            'is_current': i == last
+        })
+    
+    return tuple(breadcrumbs)
+
+
+# Security headers middleware
+def set_security_headers(response):
+    """Set security headers on all responses."""
+    # Static assets only need nosniff; CSP/framing/HSTS come with the pages
+    if request.endpoint == 'static':
+        response.headers['X-Content-Type-Options'] = 'nosniff'
+        return response
+    
+    # HSTS only outside debug mode
+    if current_app.config['DEBUG']:
+        response.headers.update(_SECURITY_HEADERS)
+    else:
+        response.headers.update(_SECURITY_HEADERS_PROD)
+    return response
+
+
+# Context processors
+def inject_navigation():
+    """Inject navigation items into all templates."""
+    return {'nav_items': _nav_for_endpoint(request.endpoint)}
+
+
+def inject_breadcrumbs():
+    """Inject breadcrumbs into templates based on current path."""
+    return {'breadcrumbs': _build_breadcrumbs(request.path)}
+
+
+# Error handlers
+def handle_csrf_error(e):
+    """Handle CSRF validation errors."""
+    logger.warning(f"CSRF validation failed", extra={
+        'session_id': session.get('id', 'unknown'),
+        'source_ip': request.remote_addr,
+        'error': str(e)
+    })
+    
+    # Return JSON for API requests, HTML for browser requests
+    if _wants_json():
+        return jsonify(_CSRF_ERROR_JSON), 403
+    
+    return render_template('errors/403.html', **_CSRF_ERROR_PAGE), 403
+
+
+def handle_bad_request(e):
+    """Handle bad request errors."""
+    if _wants_json():
+        return jsonify(_BAD_REQUEST_JSON), 400
+    
+    return render_template('errors/400.html', **_BAD_REQUEST_PAGE), 400
+
+
+def handle_not_found(e):
+    """Handle not found errors."""
+    if _wants_json():
+        return jsonify(_NOT_FOUND_JSON), 404
+    
+    return render_template('errors/404.html'), 404
+
+
+def handle_rate_limit(e):
+    """Handle rate limit errors."""
+    if _wants_json():
+        return jsonify(_RATE_LIMIT_JSON), 429
+    
+    return render_template('errors/429.html', **_RATE_LIMIT_PAGE), 429
+
+
+def handle_server_error(e):
+    """Handle internal server errors."""
+    logger.error(f"Internal server error", extra={
+        'session_id': session.get('id', 'unknown'),
+        'error': str(e)
+    })
+    
+    if _wants_json():
+        return jsonify(_SERVER_ERROR_JSON), 500
+    
+    return render_template('errors/500.html',
+                         error_code='SERVER_ERROR',
+                         technical_details=str(e) if current_app.debug else None), 500
+
+
 def create_app():
     """Application factory pattern."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.url_map.converters.update(_URL_CONVERTERS)
     
     # Load configuration (lazy loading)
     config = get_config()
-    app.config.from_object(config)
+    app.config.update(config.as_mapping())
+    
+    # Command whitelist: set for O(1) checks, sorted list for error responses
+    allowed_commands = config.ALLOWED_COMMANDS
+    allowed_commands_list = sorted(allowed_commands)
     
     # Initialize extensions
     csrf = CSRFProtect(app)
-    Session(app)
-    socketio = SocketIO(app, cors_allowed_origins="*")
+    # Threading mode: request handlers block on make subprocesses, so each
+    # gets a real OS thread (served by gunicorn's gthread worker in
+    # production) instead of sharing an unpatched eventlet hub
+    socketio = SocketIO(app, async_mode='threading', cors_allowed_origins="*")
+    
+    def get_config_manager():
+        """Get the shared AhabConfigManager (created on first use).
+        
+        The manager re-reads ahab.conf on every call, so one instance
+        stays valid across set_os() updates.
+        """
+        config_mgr = app.extensions.get('config_mgr')
+        if config_mgr is None:
+            config_mgr = _create_config_manager(config.AHAB_PATH)
+            app.extensions['config_mgr'] = config_mgr
+        return config_mgr
+    
+    executor_lock = threading.Lock()
+    
+    def get_executor():
+        """Get the shared CommandExecutor (created on first use).
+        
+        One executor per app lets every request see the same set of
+        running commands. Creation is locked so concurrent first requests
+        cannot each build (and keep) their own.
+        """
+        executor = app.extensions.get('executor')
+        if executor is None:
+            with executor_lock:
+                executor = app.extensions.get('executor')
+                if executor is None:
+                    executor = CommandExecutor(config.AHAB_PATH, timeout=config.COMMAND_TIMEOUT)
+                    app.extensions['executor'] = executor
+        return executor
     
     # Security headers middleware
-    @app.after_request
-    def set_security_headers(response):
-        """Set security headers on all responses."""
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        response.headers['Content-Security-Policy'] = "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"
-        if not app.config['DEBUG']:
-            response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-        return response
+    app.after_request(set_security_headers)
     
     # Context processors
-    @app.context_processor
-    def inject_navigation():
-        """Inject navigation items into all templates."""
-        # Get current path for determining active nav item
-        current_path = request.path
-        
-        # Define navigation items with progressive disclosure
-        # Items are shown/hidden based on system state (to be implemented)
-        nav_items = [
-            {
-                'label': 'Home',
-                'url': '/',
-                'is_current': current_path == '/',
-                'is_available': True,
-                'icon': 'home'
-            },
-            {
-                'label': 'Workstation',
-                'url': '/workstation',
-                'is_current': current_path.startswith('/workstation'),
-                'is_available': True,
-                'icon': 'server'
-            },
-            {
-                'label': 'Services',
-                'url': '/services',
-                'is_current': current_path.startswith('/services'),
-                'is_available': True,
-                'icon': 'grid'
-            },
-            {
-                'label': 'Network',
-                'url': '/network',
-                'is_current': current_path.startswith('/network'),
-                'is_available': True,
-                'icon': 'network'
-            },
-            {
-                'label': 'Tests',
-                'url': '/tests',
-                'is_current': current_path.startswith('/tests'),
-                'is_available': True,
-                'icon': 'check'
-            },
-            {
-                'label': 'Help',
-                'url': '/help',
-                'is_current': current_path.startswith('/help'),
-                'is_available': True,
-                'icon': 'help'
-            }
-        ]
-        
-        return {'nav_items': nav_items}
-    
-    @app.context_processor
-    def inject_breadcrumbs():
-        """Inject breadcrumbs into templates based on current path."""
-        current_path = request.path
-        breadcrumbs = []
-        
-        # Always start with Home
-        if current_path != '/':
-            breadcrumbs.append({
-                'label': 'Home',
-                'url': '/',
-                'is_current': False
-            })
-        
-        # Parse path to generate breadcrumbs
-        path_parts = [p for p in current_path.split('/') if p]
-        
-        if path_parts:
-            # Build breadcrumbs from path
-            current_url = ''
-            for i, part in enumerate(path_parts):
-                current_url += '/' + part
-                is_last = (i == len(path_parts) - 1)
-                
-                # Capitalize and format label
-                label = part.replace('-', ' ').title()
-                
-                breadcrumbs.append({
-                    'label': label,
-                    'url': current_url,
-                    'is_current': is_last
-                })
-        
-        return {'breadcrumbs': breadcrumbs if len(breadcrumbs) > 1 else []}
+    app.context_processor(inject_navigation)
+    app.context_processor(inject_breadcrumbs)
     
     # Error handlers
-    @app.errorhandler(CSRFError)
-    def handle_csrf_error(e):
-        """Handle CSRF validation errors."""
-        logger.warning(f"CSRF validation failed", extra={
-            'session_id': session.get('id', 'unknown'),
-            'source_ip': request.remote_addr,
-            'error': str(e)
-        })
-        
-        # Return JSON for API requests, HTML for browser requests
-        if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'error': True,
-                'message': 'Security validation failed. Please refresh the page.',
-                'code': 'CSRF_ERROR'
-            }), 403
-        
-        return render_template('errors/403.html', 
-                             error_code='CSRF_ERROR',
-                             error_title='Security Validation Failed',
-                             error_message='Your session security token is invalid. This usually happens when your session expires.',
-                             recovery_actions=[
-                                 'Refresh the page to get a new security token',
-                                 'Clear your browser cookies and try again',
-                                 'Go back to the dashboard',
-                                 'Contact support if the problem persists'
-                             ]), 403
-    
-    @app.errorhandler(400)
-    def handle_bad_request(e):
-        """Handle bad request errors."""
-        if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'error': True,
-                'message': 'Invalid request.',
-                'code': 'BAD_REQUEST'
-            }), 400
-        
-        return render_template('errors/400.html',
-                             error_code='BAD_REQUEST',
-                             error_title='Invalid Request',
-                             error_message='The request you sent was not valid. This might be due to incorrect data or a malformed URL.',
-                             recovery_actions=[
-                                 'Check the URL for errors',
-                                 'Go back and try again',
-                                 'Return to the dashboard',
-                                 'Contact support if you need help'
-                             ]), 400
-    
-    @app.errorhandler(404)
-    def handle_not_found(e):
-        """Handle not found errors."""
-        if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'error': True,
-                'message': 'Resource not found.',
-                'code': 'NOT_FOUND'
-            }), 404
-        
-        return render_template('errors/404.html'), 404
-    
-    @app.errorhandler(429)
-    def handle_rate_limit(e):
-        """Handle rate limit errors."""
-        if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'error': True,
-                'message': 'Too many requests. Please wait a moment.',
-                'code': 'RATE_LIMIT'
-            }), 429
-        
-        return render_template('errors/429.html',
-                             error_code='RATE_LIMIT',
-                             error_title='Too Many Requests',
-                             error_message='You\'ve made too many requests in a short time. Please wait a moment before trying again.',
-                             recovery_actions=[
-                                 'Wait 30 seconds and try again',
-                                 'Avoid clicking buttons multiple times',
-                                 'Return to the dashboard',
-                                 'Contact support if you need immediate assistance'
-                             ]), 429
-    
-    @app.errorhandler(500)
-    def handle_server_error(e):
-        """Handle internal server errors."""
-        logger.error(f"Internal server error", extra={
-            'session_id': session.get('id', 'unknown'),
-            'error': str(e)
-        })
-        
-        if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'error': True,
-                'message': 'An error occurred. Please try again.',
-                'code': 'SERVER_ERROR'
-            }), 500
-        
-        return render_template('errors/500.html',
-                             error_code='SERVER_ERROR',
-                             technical_details=str(e) if app.debug else None), 500
+    app.register_error_handler(CSRFError, handle_csrf_error)
+    app.register_error_handler(400, handle_bad_request)
+    app.register_error_handler(404, handle_not_found)
+    app.register_error_handler(429, handle_rate_limit)
+    app.register_error_handler(500, handle_server_error)
+    
+    # Compile the error templates up front so the first error of each kind
+    # doesn't pay for it. The rendered HTML itself can't be cached: it
+    # embeds the session's CSRF token and per-path navigation/breadcrumbs.
+    for template_name in _ERROR_TEMPLATES:
+        app.jinja_env.get_template(template_name)
     
     # Routes
     @app.route('/')
@@ -266,9 +561,8 @@ def create_app():
         """Render main dashboard."""
         # Initialize session if needed
         if 'id' not in session:
-            import uuid
-            session['id'] = str(uuid.uuid4())
-            session['created_at'] = str(os.times())
+            session['id'] = uuid.uuid4().hex
+            session['created_at'] = time.time()
             logger.info(f"New session created", extra={'session_id': session['id']})
         
         return render_template('index.html')
@@ -314,37 +608,15 @@ def create_app():
     @app.route('/api/whitelist', methods=['GET'])
     def get_whitelist():
         """Return the command whitelist (read-only)."""
-        # This will be implemented when we create the executor
-        whitelist = {
-            'commands': [
-                'install',
-                'test',
-                'status',
-                'clean',
-                'ssh',
-                'verify-install',
-                'network-switches',
-                'network-switches-version',
-                'network-switches-test'
-            ],
-            'services': [
-                'apache',
-                'mysql',
-                'php'
-            ],
-            'network': [
-                'switches'
-            ]
-        }
-        return jsonify(whitelist)
+        response = Response(_WHITELIST_JSON, mimetype='application/json')
+        response.headers['Cache-Control'] = 'public, max-age=3600'
+        return response
     
     @app.route('/api/os/current', methods=['GET'])
     def get_current_os():
         """Get currently configured OS."""
         try:
-            from lib.config_manager import AhabConfigManager
-            
-            config_mgr = AhabConfigManager(config.AHAB_PATH)
+            config_mgr = get_config_manager()
             current_os = config_mgr.get_current_os()
             oses = config_mgr.get_supported_oses()
             
@@ -365,9 +637,7 @@ def create_app():
     def set_os():
         """Set OS in ahab.conf."""
         try:
-            from lib.config_manager import AhabConfigManager
-            
-            data = request.get_json()
+            data = _request_json(allow_empty=True)
             os_name = data.get('os')
             
             if not os_name:
@@ -377,7 +647,7 @@ def create_app():
                     'code': 'MISSING_PARAMETER'
                 }), 400
             
-            config_mgr = AhabConfigManager(config.AHAB_PATH)
+            config_mgr = get_config_manager()
             
             # Validate OS name
             if os_name not in config_mgr.SUPPORTED_OSES:
@@ -422,9 +692,7 @@ def create_app():
     def validate_config():
         """Validate ahab.conf configuration."""
         try:
-            from lib.config_manager import AhabConfigManager
-            
-            config_mgr = AhabConfigManager(config.AHAB_PATH)
+            config_mgr = get_config_manager()
             validation = config_mgr.validate_config()
             
             return jsonify({
@@ -443,13 +711,11 @@ def create_app():
     def get_status():
         """Get system status."""
         try:
-            from commands.executor import get_system_status, CommandExecutor
-            
             # Get system status
             status = get_system_status(config.AHAB_PATH)
             
             # Check for running commands
-            executor = CommandExecutor(config.AHAB_PATH)
+            executor = get_executor()
             running_commands = executor.get_running_commands()
             
             status['command_running'] = len(running_commands) > 0
@@ -468,9 +734,7 @@ def create_app():
     @app.route('/api/execute', methods=['POST'])
     def execute_command():
         """Execute a whitelisted command."""
-        from commands.executor import CommandExecutor
-        
-        data = request.get_json()
+        data = _request_json(allow_empty=True)
         
         if not data or 'command' not in data:
             return jsonify({
@@ -481,17 +745,18 @@ def create_app():
         
         command = data.get('command')
         
-        # Validate command is whitelisted
-        if command not in config.ALLOWED_COMMANDS:
+        # Validate command is whitelisted (non-strings can't be hashed
+        # into the set lookup)
+        if not isinstance(command, str) or command not in allowed_commands:
             return jsonify({
                 'error': True,
                 'message': f'Command not allowed: {command}',
                 'code': 'COMMAND_NOT_ALLOWED',
-                'allowed_commands': config.ALLOWED_COMMANDS
+                'allowed_commands': allowed_commands_list
             }), 400
         
         try:
-            executor = CommandExecutor(config.AHAB_PATH, timeout=config.COMMAND_TIMEOUT)
+            executor = get_executor()
             
             # Check if command is already running
             if executor.is_running(command):
@@ -511,13 +776,20 @@ def create_app():
                 'success': result.success
             })
             
+            # Plain-text clients get the raw log without JSON escaping
+            if request.accept_mimetypes.best_match(_EXECUTE_MIMETYPES) == 'text/plain':
+                return Response(result.output, mimetype='text/plain', headers={
+                    'X-Exit-Code': str(result.exit_code),
+                    'X-Duration': f'{result.duration:.3f}'
+                })
+            
             return jsonify({
                 'success': result.success,
                 'command': command,
                 'exit_code': result.exit_code,
                 'output': result.output,
                 'duration': result.duration,
-                'timestamp': result.timestamp.isoformat()
+                'timestamp': result.timestamp
             })
             
         except ValueError as e:
@@ -536,69 +808,19 @@ def create_app():
             }), 500
     
     # Service management routes
-    @app.route('/services/<service_name>/install', methods=['POST'])
-    def install_service(service_name):
-        """Install a service."""
-        # Validate service name
-        valid_services = ['apache', 'mysql', 'php']
-        if service_name not in valid_services:
-            return jsonify({
-                'error': True,
-                'message': f'Invalid service: {service_name}',
-                'code': 'INVALID_SERVICE'
-            }), 400
-        
-        # TODO: Implement actual service installation via CommandExecutor
-        # For now, return success
-        logger.info(f"Installing service: {service_name}")
-        
-        return jsonify({
-            'success': True,
-            'message': f'{service_name} installed successfully',
-            'service': service_name
-        })
-    
-    @app.route('/services/<service_name>/restart', methods=['POST'])
-    def restart_service(service_name):
-        """Restart a service."""
-        # Validate service name
-        valid_services = ['apache', 'mysql', 'php']
-        if service_name not in valid_services:
-            return jsonify({
-                'error': True,
-                'message': f'Invalid service: {service_name}',
-                'code': 'INVALID_SERVICE'
-            }), 400
-        
-        # TODO: Implement actual service restart via CommandExecutor
-        # For now, return success
-        logger.info(f"Restarting service: {service_name}")
-        
-        return jsonify({
-            'success': True,
-            'message': f'{service_name} restarted successfully',
-            'service': service_name
-        })
-    
-    @app.route('/services/<service_name>/remove', methods=['POST'])
-    def remove_service(service_name):
-        """Remove a service."""
-        # Validate service name
-        valid_services = ['apache', 'mysql', 'php']
-        if service_name not in valid_services:
-            return jsonify({
-                'error': True,
-                'message': f'Invalid service: {service_name}',
-                'code': 'INVALID_SERVICE'
-            }), 400
+    # (service name and action are validated by the URL converters)
+    @app.route('/services/<service:service_name>/<service_action:action>', methods=['POST'])
+    def manage_service(service_name, action):
+        """Install, restart or remove a service."""
+        progress, done = _SERVICE_ACTIONS[action]
         
-        # TODO: Implement actual service removal via CommandExecutor
+        # TODO: Implement actual service actions via CommandExecutor
         # For now, return success
-        logger.info(f"Removing service: {service_name}")
+        logger.info(f"{progress} service: {service_name}")
         
         return jsonify({
             'success': True,
-            'message': f'{service_name} removed successfully',
+            'message': f'{service_name} {done} successfully',
             'service': service_name
         })
     
@@ -607,20 +829,17 @@ def create_app():
     def get_workstation_status():
         """Get workstation status with timestamp."""
         try:
-            from commands.executor import get_system_status
-            from datetime import datetime
-            
             status = get_system_status(config.AHAB_PATH)
+            installed = bool(status.get('workstation_installed', False))
+            running = bool(status.get('workstation_running', False))
             
             # Enhanced status response with timestamp
             return jsonify({
                 'success': True,
-                'status_value': 'Running' if status.get('workstation_running') else 'Stopped' if status.get('workstation_installed') else 'Not Installed',
-                'status_type': 'success' if status.get('workstation_running') else 'warning' if status.get('workstation_installed') else 'info',
-                'description': 'Workstation VM is operational' if status.get('workstation_running') else 'Workstation VM exists but is stopped' if status.get('workstation_installed') else 'No workstation VM found',
-                'last_updated': datetime.now().isoformat(),
-                'workstation_installed': status.get('workstation_installed', False),
-                'workstation_running': status.get('workstation_running', False)
+                **_WORKSTATION_STATES[(installed, running)],
+                'last_updated': _now_iso(),
+                'workstation_installed': installed,
+                'workstation_running': running
             })
         except Exception as e:
             logger.error(f"Failed to get workstation status: {e}")
@@ -629,38 +848,32 @@ def create_app():
                 'status_value': 'Error',
                 'status_type': 'error',
                 'description': f'Failed to check status: {str(e)}',
-                'last_updated': datetime.now().isoformat()
+                'last_updated': _now_iso()
             }), 500
     
     @app.route('/api/services/<service_name>/status', methods=['GET'])
     def get_service_status(service_name):
         """Get service status with timestamp."""
         try:
-            from commands.executor import get_system_status
-            from datetime import datetime
-            
             # Validate service name
-            valid_services = ['apache', 'mysql', 'php', 'nginx']
-            if service_name not in valid_services:
+            if service_name not in _STATUS_SERVICES:
                 return jsonify({
                     'success': False,
                     'status_value': 'Invalid Service',
                     'status_type': 'error',
                     'description': f'Service {service_name} is not supported',
-                    'last_updated': datetime.now().isoformat()
+                    'last_updated': _now_iso()
                 }), 400
             
             status = get_system_status(config.AHAB_PATH)
             service_key = f'{service_name}_installed'
-            is_installed = status.get(service_key, False)
+            is_installed = bool(status.get(service_key, False))
             
             # Enhanced status response
             return jsonify({
                 'success': True,
-                'status_value': 'Running' if is_installed else 'Not Installed',
-                'status_type': 'success' if is_installed else 'info',
-                'description': f'{service_name.title()} service is operational' if is_installed else f'{service_name.title()} service is not installed',
-                'last_updated': datetime.now().isoformat(),
+                **_SERVICE_STATES[(service_name, is_installed)],
+                'last_updated': _now_iso(),
                 'service_installed': is_installed
             })
         except Exception as e:
@@ -670,84 +883,35 @@ def create_app():
                 'status_value': 'Error',
                 'status_type': 'error',
                 'description': f'Failed to check {service_name} status: {str(e)}',
-                'last_updated': datetime.now().isoformat()
+                'last_updated': _now_iso()
             }), 500
     
     # Network switch management API endpoints
-    @app.route('/api/network/switches/version', methods=['POST'])
-    def get_switches_version():
-        """Get version information from network switches."""
-        from commands.executor import CommandExecutor
-        
-        data = request.get_json()
+    # (action is validated by the URL converter)
+    @app.route('/api/network/switches/<switch_action:action>', methods=['POST'])
+    def run_switches_command(action):
+        """Run a network switches command (version, test or manage)."""
+        data = _request_json()
         env = data.get('environment', 'dev')
         
-        # Validate environment
-        valid_envs = ['dev', 'prod']
-        if env not in valid_envs:
+        # Validate environment (non-strings can't be hashed into the set lookup)
+        if not isinstance(env, str) or env not in _VALID_ENVS:
             return jsonify({
                 'error': True,
                 'message': f'Invalid environment: {env}',
                 'code': 'INVALID_ENVIRONMENT'
             }), 400
         
-        try:
-            executor = CommandExecutor(config.AHAB_PATH, timeout=config.COMMAND_TIMEOUT)
-            
-            # Execute network switches version command
-            command = f'network-switches-version ENV={env}'
-            result = executor.execute(command)
-            
-            logger.info(f"Network switches version command executed", extra={
-                'command': command,
-                'environment': env,
-                'exit_code': result.exit_code,
-                'success': result.success
-            })
-            
-            return jsonify({
-                'success': result.success,
-                'command': command,
-                'environment': env,
-                'exit_code': result.exit_code,
-                'output': result.output,
-                'duration': result.duration,
-                'timestamp': result.timestamp.isoformat()
-            })
-            
-        except Exception as e:
-            logger.error(f"Network switches version command failed: {e}")
-            return jsonify({
-                'error': True,
-                'message': str(e),
-                'code': 'EXECUTION_ERROR'
-            }), 500
-    
-    @app.route('/api/network/switches/test', methods=['POST'])
-    def test_switches_connectivity():
-        """Test connectivity to network switches."""
-        from commands.executor import CommandExecutor
-        
-        data = request.get_json()
-        env = data.get('environment', 'dev')
-        
-        # Validate environment
-        valid_envs = ['dev', 'prod']
-        if env not in valid_envs:
-            return jsonify({
-                'error': True,
-                'message': f'Invalid environment: {env}',
-                'code': 'INVALID_ENVIRONMENT'
-            }), 400
+        _, label = _SWITCH_ACTIONS[action]
         
         try:
-            executor = CommandExecutor(config.AHAB_PATH, timeout=config.COMMAND_TIMEOUT)
+            executor = get_executor()
             
-            # Execute network switches test command
-            command = f'network-switches-test ENV={env}'
+            # Execute network switches command
+            command = _SWITCH_COMMANDS[(action, env)]
             result = executor.execute(command)
             
-            logger.info(f"Network switches test command executed", extra={
+            logger.info(f"Network switches {label} command executed", extra={
                 'command': command,
                 'environment': env,
                 'exit_code': result.exit_code,
@@ -761,60 +925,11 @@ def create_app():
                 'exit_code': result.exit_code,
                 'output': result.output,
                 'duration': result.duration,
-                'timestamp': result.timestamp.isoformat()
+                'timestamp': result.timestamp
             })
             
         except Exception as e:
-            logger.error(f"Network switches test command failed: {e}")
-            return jsonify({
-                'error': True,
-                'message': str(e),
-                'code': 'EXECUTION_ERROR'
-            }), 500
-    
-    @app.route('/api/network/switches/manage', methods=['POST'])
-    def manage_switches():
-        """Manage network switches (full management)."""
-        from commands.executor import CommandExecutor
-        
-        data = request.get_json()
-        env = data.get('environment', 'dev')
-        
-        # Validate environment
-        valid_envs = ['dev', 'prod']
-        if env not in valid_envs:
-            return jsonify({
-                'error': True,
-                'message': f'Invalid environment: {env}',
-                'code': 'INVALID_ENVIRONMENT'
-            }), 400
-        
-        try:
-            executor = CommandExecutor(config.AHAB_PATH, timeout=config.COMMAND_TIMEOUT)
-            
-            # Execute network switches management command
-            command = f'network-switches ENV={env}'
-            result = executor.execute(command)
-            
-            logger.info(f"Network switches management command executed", extra={
-                'command': command,
-                'environment': env,
-                'exit_code': result.exit_code,
-                'success': result.success
-            })
-            
-            return jsonify({
-                'success': result.success,
-                'command': command,
-                'environment': env,
-                'exit_code': result.exit_code,
-                'output': result.output,
-                'duration': result.duration,
-                'timestamp': result.timestamp.isoformat()
-            })
-            
-        except Exception as e:
-            logger.error(f"Network switches management command failed: {e}")
+            logger.error(f"Network switches {label} command failed: {e}")
             return jsonify({
                 'error': True,
                 'message': str(e),
@@ -828,15 +943,44 @@ def create_app():
 app, socketio = create_app()
 
 
+def _serve_production(host, port):
+    """Serve the app with gunicorn's threaded worker.
+    
+    One process with many threads: Socket.IO session state lives in memory,
+    and request handlers block on make subprocesses.
+    """
+    from gunicorn.app.base import BaseApplication
+    
+    class GunicornServer(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', 1)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', 100)
+        
+        def load(self):
+            return app
+    
+    GunicornServer().run()
+
+
 if __name__ == '__main__':
     config = get_config()
     logger.info(f"Starting Ahab GUI on {config.WUI_HOST}:{config.WUI_PORT}")
     logger.info(f"Debug mode: {config.DEBUG}")
     logger.info(f"Ahab path: {config.AHAB_PATH}")
     
-    socketio.run(
-        app,
-        host=config.WUI_HOST,
-        port=config.WUI_PORT,
-        debug=config.DEBUG
-    )
+    if config.DEBUG:
+        # Development server with the reloader and debugger. Flask-SocketIO
+        # refuses to start Werkzeug without a TTY (nohup, IDE runs, containers
+        # without -t) unless told this is not production; this branch only
+        # runs in development, so allow it
+        socketio.run(
+            app,
+            host=config.WUI_HOST,
+            port=config.WUI_PORT,
+            debug=True,
+            allow_unsafe_werkzeug=True
+        )
+    else:
+        _serve_production(config.WUI_HOST, config.WUI_PORT)
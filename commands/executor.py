@@ -7,21 +7,75 @@ This module provides the CommandExecutor class which:
 - Tracks command state (running/stopped)
 - Handles timeouts
 - Prevents concurrent execution of the same command
+- Optionally coalesces streamed lines into batches
 """
 
+import shutil
 import subprocess
 import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Dict
+from typing import Callable, Optional, Dict, List, Tuple
+import os
 import re
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
-@dataclass
+
+# Bytes requested per read from the command's stdout pipe
+READ_CHUNK_SIZE = 65536
+
+# Requested stdout pipe capacity (Linux only), so chatty commands rarely
+# block on a full pipe between reads
+PIPE_SIZE = 1 << 20
+_F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', None)
+
+# Workstation line printed by make status -> (installed, running)
+_WORKSTATION_RE = re.compile(r'Workstation:[ \t]*(Running|Stopped|Not Created)')
+_WORKSTATION_STATES = {
+    'Running': (True, True),
+    'Stopped': (True, False),
+    'Not Created': (False, False),
+}
+
+# docker ps line for a running ahab container: "ahab_<service> ... Up ..."
+_SERVICE_RE = re.compile(r'^[ \t]*(ahab_(\S+))[ \t].*Up', re.MULTILINE)
+
+# ANSI escape sequences (str and bytes forms)
+_ANSI_RE_STR = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_ANSI_RE = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
+def split_carriage_returns(line: str) -> Tuple[str, ...]:
+    """Split one newline-terminated output line the way text mode would.
+    
+    Output is read as bytes, so carriage returns arrive untranslated: a
+    CRLF ending loses its CR, and each bare CR (progress redraws) ends a
+    line of its own. Those progress lines are delivered once the newline
+    that finishes the run arrives.
+    """
+    if '\r' not in line:
+        return (line,)
+    if line.endswith('\r'):
+        line = line[:-1]
+    return tuple(line.split('\r'))
+
+
+def normalize_newlines(output: str) -> str:
+    """Translate CRLF and bare CR to LF, as universal newlines mode did."""
+    if '\r' not in output:
+        return output
+    return output.replace('\r\n', '\n').replace('\r', '\n')
+
+
+@dataclass(slots=True, frozen=True)
 class ExecutionResult:
-    """Result of a command execution."""
+    """Result of a command execution (immutable once returned)."""
     command: str
     exit_code: int
     output: str
@@ -30,14 +84,45 @@ class ExecutionResult:
     success: bool
 
 
-@dataclass
-class CommandState:
-    """State of a running command."""
-    command: str
-    running: bool
-    pid: Optional[int]
-    started_at: Optional[datetime]
-    process: Optional[subprocess.Popen]
+class OutputBatcher:
+    """Coalesces streamed output lines into batches.
+
+    Lines are handed to the sink as a list once max_lines have queued, or
+    when a line arrives more than interval seconds after the last flush.
+    Nothing runs in the background: readers flush() whenever their pipe
+    goes quiet and once output ends, so a line followed by silence is not
+    held back until the next one.
+    """
+
+    def __init__(self, sink: Callable[[List[str]], None],
+                 max_lines: int = 64, interval: float = 0.05):
+        """Initialize the batcher.
+
+        Args:
+            sink: Callback receiving each batch of lines
+            max_lines: Flush once this many lines are queued
+            interval: Flush on the next line once this many seconds have
+                passed since the last flush
+        """
+        self._sink = sink
+        self._max_lines = max_lines
+        self._interval = interval
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, line: str) -> None:
+        """Queue a line, flushing if the batch is full or the interval passed."""
+        self._pending.append(line)
+        if (len(self._pending) >= self._max_lines
+                or time.monotonic() - self._last_flush > self._interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver any queued lines immediately."""
+        self._last_flush = time.monotonic()
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._sink(batch)
 
 
 class CommandExecutor:
@@ -52,7 +137,10 @@ class CommandExecutor:
         """
         self.ahab_path = Path(ahab_path)
         self.timeout = timeout
-        self._running_commands: Dict[str, CommandState] = {}
+        # Running command -> its process (None until make has started)
+        self._running_commands: Dict[str, Optional[subprocess.Popen]] = {}
+        # Snapshot of the running names, rebuilt only when the table changes
+        self._running_names: Tuple[str, ...] = ()
         self._lock = threading.Lock()
         
         # Validate ahab path
@@ -62,13 +150,20 @@ class CommandExecutor:
         makefile = self.ahab_path / 'Makefile'
         if not makefile.exists():
             raise ValueError(f"Makefile not found in: {ahab_path}")
+        
+        # Full path to make, looked up once found so each launch skips the
+        # PATH search (see _make_path)
+        self._make: Optional[str] = shutil.which('make')
     
-    def execute(self, command: str, callback: Optional[Callable[[str], None]] = None) -> ExecutionResult:
+    def execute(self, command: str, callback: Optional[Callable[[str], None]] = None,
+                batch_callback: Optional[Callable[[List[str]], None]] = None) -> ExecutionResult:
         """Execute a make command and optionally stream output.
         
         Args:
             command: The make target to execute (e.g., 'install', 'test')
             callback: Optional callback function for streaming output line-by-line
+            batch_callback: Optional callback receiving output as batches of
+                lines (see OutputBatcher), for consumers that pay per message
         
         Returns:
             ExecutionResult with command results
@@ -77,51 +172,78 @@ class CommandExecutor:
             ValueError: If command is already running
             subprocess.TimeoutExpired: If command exceeds timeout
         """
-        # Check if command is already running
-        if self.is_running(command):
-            raise ValueError(f"Command '{command}' is already running")
-        
-        start_time = time.time()
+        start_time = time.monotonic()  # Durations are immune to clock changes
         timestamp = datetime.now()
-        output_lines = []
+        output_buf = bytearray()
+        streaming = callback is not None or batch_callback is not None
+        batcher = OutputBatcher(batch_callback) if batch_callback else None
         
-        # Mark command as running
+        # Claim the command (check and mark running in one critical section)
         with self._lock:
-            self._running_commands[command] = CommandState(
-                command=command,
-                running=True,
-                pid=None,
-                started_at=timestamp,
-                process=None
-            )
+            if command in self._running_commands:
+                raise ValueError(f"Command '{command}' is already running")
+            self._running_commands[command] = None
+            self._running_names = tuple(self._running_commands)
         
         try:
-            # Execute make command
+            # Execute make command; output is read as raw bytes and split
+            # into lines here rather than through a text-mode wrapper
             process = subprocess.Popen(
-                ['make', command],
+                [self._make_path(), command],
                 cwd=str(self.ahab_path),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True
+                bufsize=0
             )
             
+            _grow_pipe(process.stdout)
+            
             # Update process info
             with self._lock:
                 if command in self._running_commands:
-                    self._running_commands[command].pid = process.pid
-                    self._running_commands[command].process = process
+                    self._running_commands[command] = process
+            
+            # Stream output line by line; lines are only split out and
+            # decoded when someone is listening. Complete lines are decoded
+            # straight out of the read buffer through memoryview slices, so
+            # only a partial line left at the end of a read is copied.
+            buf = bytearray(READ_CHUNK_SIZE)
+            view = memoryview(buf)
+            tail = b''
+            while True:
+                n = process.stdout.readinto(view)
+                if not n:
+                    break
+                output_buf += view[:n]
+                if not streaming:
+                    continue
+                start = 0
+                end = buf.find(b'\n', 0, n)
+                while end != -1:
+                    if tail:
+                        raw, tail = tail + view[start:end], b''
+                    else:
+                        raw = view[start:end]
+                    self._emit_line(str(raw, 'utf-8', 'replace'), callback, batcher)
+                    start = end + 1
+                    end = buf.find(b'\n', start, n)
+                if start < n:
+                    tail += view[start:n]
+                # A read returns what the pipe held, so the lines so far go
+                # out now rather than waiting on output that may be minutes
+                # away; chatty commands still fill whole batches per read
+                if batcher:
+                    batcher.flush()
             
-            # Stream output line by line
-            for line in process.stdout:
-                output_lines.append(line)
-                if callback:
-                    callback(line.rstrip('\n'))
+            # Output that did not end with a newline
+            if tail:
+                self._emit_line(tail.decode('utf-8', 'replace'), callback, batcher)
             
-            # Wait for process to complete
-            process.wait(timeout=self.timeout)
-            exit_code = process.returncode
+            # stdout is at EOF, so make has normally exited already; only
+            # fall back to a bounded wait if it is still shutting down
+            exit_code = process.poll()
+            if exit_code is None:
+                exit_code = process.wait(timeout=self.timeout)
             
         except subprocess.TimeoutExpired:
             # Kill the process if it times out
@@ -131,13 +253,17 @@ class CommandExecutor:
             raise
         
         finally:
+            if batcher:
+                batcher.flush()
+            
             # Mark command as no longer running
             with self._lock:
                 if command in self._running_commands:
                     del self._running_commands[command]
+                    self._running_names = tuple(self._running_commands)
         
-        duration = time.time() - start_time
-        output = ''.join(output_lines)
+        duration = time.monotonic() - start_time
+        output = normalize_newlines(output_buf.decode('utf-8', 'replace'))
         
         return ExecutionResult(
             command=command,
@@ -148,6 +274,29 @@ class CommandExecutor:
             success=(exit_code == 0)
         )
     
+    def _make_path(self) -> str:
+        """Get the path to make, resolving it on first use.
+        
+        A missing make is not an error until a command runs (the status
+        endpoints share this executor); Popen then reports it as before.
+        """
+        make = self._make
+        if make is None:
+            make = shutil.which('make')
+            if make is None:
+                return 'make'
+            self._make = make
+        return make
+    
+    @staticmethod
+    def _emit_line(line: str, callback, batcher) -> None:
+        """Hand one decoded output line to the streaming consumers."""
+        for part in split_carriage_returns(line):
+            if callback:
+                callback(part)
+            if batcher:
+                batcher.add(part)
+    
     def is_running(self, command: str) -> bool:
         """Check if a command is currently running.
         
@@ -157,17 +306,17 @@ class CommandExecutor:
         Returns:
             True if command is running, False otherwise
         """
-        with self._lock:
-            return command in self._running_commands and self._running_commands[command].running
+        # Single dict lookups are atomic; the lock only guards compound updates
+        return command in self._running_commands
     
-    def get_running_commands(self) -> list:
-        """Get list of currently running commands.
+    def get_running_commands(self) -> Tuple[str, ...]:
+        """Get currently running commands.
         
         Returns:
-            List of command names that are currently running
+            Tuple of command names that are currently running (a shared,
+            immutable snapshot; no copy is made per call)
         """
-        with self._lock:
-            return list(self._running_commands.keys())
+        return self._running_names
     
     def kill(self, command: str) -> bool:
         """Kill a running command.
@@ -179,14 +328,11 @@ class CommandExecutor:
             True if command was killed, False if not running
         """
         with self._lock:
-            if command not in self._running_commands:
-                return False
-            
-            state = self._running_commands[command]
-            if state.process:
+            process = self._running_commands.get(command)
+            if process:
                 try:
-                    state.process.kill()
-                    state.process.wait()
+                    process.kill()
+                    process.wait()
                     return True
                 except Exception:
                     return False
@@ -208,28 +354,133 @@ class CommandExecutor:
         return text
     
     @staticmethod
-    def strip_ansi_codes(text: str) -> str:
+    def strip_ansi_codes(text):
         """Strip ANSI color codes from text.
         
         Args:
-            text: Text potentially containing ANSI codes
+            text: Text (str) or raw output (bytes) potentially containing
+                ANSI codes
         
         Returns:
-            Text with ANSI codes removed
+            Text with ANSI codes removed, of the same type as the input
         """
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        # Most output has no escapes at all; a plain ESC search (memchr
+        # for bytes) is far cheaper than running the regex engine
+        if isinstance(text, (bytes, bytearray)):
+            if b'\x1b' not in text:
+                return text
+            return _ANSI_RE.sub(b'', text)
+        if '\x1b' not in text:
+            return text
+        return _ANSI_RE_STR.sub('', text)
+
+
+def parse_workstation_state(output: str) -> Optional[Tuple[bool, bool]]:
+    """Read the workstation line from make status output.
+    
+    Args:
+        output: make status output
+    
+    Returns:
+        (installed, running) tuple, or None if no workstation line was found
+    """
+    match = _WORKSTATION_RE.search(output)
+    return _WORKSTATION_STATES[match.group(1)] if match else None
+
+
+def parse_running_services(output: str) -> List[dict]:
+    """Extract running ahab containers from make status output.
+    
+    Matches docker ps lines whose first column is an ahab_<service>
+    container and that report the container as Up.
+    
+    Args:
+        output: make status output
+    
+    Returns:
+        List of service dicts with name, status and container
+    """
+    return [
+        {'name': match.group(2), 'status': 'running', 'container': match.group(1)}
+        for match in _SERVICE_RE.finditer(output)
+    ]
+
+
+def _grow_pipe(pipe) -> None:
+    """Enlarge a pipe's kernel buffer where supported (best effort)."""
+    if _F_SETPIPE_SZ is None:
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, PIPE_SIZE)
+    except OSError:
+        # Above /proc/sys/fs/pipe-max-size or the per-user pipe quota;
+        # the default 64 KiB pipe still works
+        pass
+
+
+# Seconds a make status result is served before it is refreshed
+STATUS_CACHE_TTL = 2.0
+
+_status_cache: Dict[str, tuple] = {}
+_status_refreshing: set = set()
+_status_cache_lock = threading.Lock()
+_status_probe_lock = threading.Lock()
 
 
 def get_system_status(ahab_path: str) -> dict:
     """Get current system status using make status command.
     
+    Results are cached per ahab path. Once an entry is older than
+    STATUS_CACHE_TTL seconds it is still returned, while a background
+    thread re-runs make status; only the very first call for a path waits
+    for the subprocess.
+    
     Args:
         ahab_path: Path to the ahab directory
     
     Returns:
         Dictionary with system status information
     """
+    key = str(ahab_path)
+    cached = _status_cache.get(key)
+    if cached is None:
+        with _status_probe_lock:
+            # Another thread may have probed while we waited
+            cached = _status_cache.get(key)
+            if cached is None:
+                cached = _store_system_status(key, ahab_path)
+    elif time.monotonic() >= cached[0]:
+        _schedule_status_refresh(key, ahab_path)
+    return dict(cached[1])
+
+
+def _store_system_status(key: str, ahab_path: str) -> tuple:
+    """Probe the system and cache the result."""
+    entry = (time.monotonic() + STATUS_CACHE_TTL, _probe_system_status(ahab_path))
+    _status_cache[key] = entry
+    return entry
+
+
+def _schedule_status_refresh(key: str, ahab_path: str) -> None:
+    """Start a background probe unless one is already running for key."""
+    with _status_cache_lock:
+        if key in _status_refreshing:
+            return
+        _status_refreshing.add(key)
+    threading.Thread(target=_refresh_system_status, args=(key, ahab_path),
+                     name='ahab-status-refresh', daemon=True).start()
+
+
+def _refresh_system_status(key: str, ahab_path: str) -> None:
+    try:
+        _store_system_status(key, ahab_path)
+    finally:
+        with _status_cache_lock:
+            _status_refreshing.discard(key)
+
+
+def _probe_system_status(ahab_path: str) -> dict:
+    """Run make status and parse the result (uncached)."""
     ahab_path = Path(ahab_path)
     
     # Use make status command (follows ahab-development.md rules)
@@ -250,36 +501,16 @@ def get_system_status(ahab_path: str) -> dict:
             output = result.stdout
             
             # Parse make status output
-            if '✓ Workstation: Running' in output:
-                workstation_installed = True
-                workstation_running = True
-            elif '⚠ Workstation: Stopped' in output:
-                workstation_installed = True
-                workstation_running = False
-            elif '○ Workstation: Not Created' in output:
-                workstation_installed = False
-                workstation_running = False
+            state = parse_workstation_state(output)
+            if state is not None:
+                workstation_installed, workstation_running = state
             
             # Parse services from docker ps output in make status
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if 'ahab_' in line and 'Up' in line:
-                    # Extract service name from docker container name
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        container_name = parts[0]
-                        if container_name.startswith('ahab_'):
-                            service_name = container_name.replace('ahab_', '')
-                            services.append({
-                                'name': service_name,
-                                'status': 'running',
-                                'container': container_name
-                            })
+            services = parse_running_services(output)
         
     except Exception as e:
         # Fallback: check if .vagrant directory exists
-        vagrant_dir = ahab_path / '.vagrant'
-        workstation_installed = vagrant_dir.exists()
+        workstation_installed = os.path.isdir(os.path.join(ahab_path, '.vagrant'))
     
     return {
         'workstation_installed': workstation_installed,
@@ -13,19 +13,27 @@ Last Updated: December 10, 2025
 Status: MANDATORY
 """
 
+import selectors
 import subprocess
 import threading
 import time
 import os
 import signal
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Dict, List, Any
+from typing import Callable, Optional, Deque, Dict, List, Any
 import re
 import json
 import logging
 
+from commands.executor import (
+    OutputBatcher, normalize_newlines, parse_running_services, parse_workstation_state,
+    split_carriage_returns,
+)
+
 # Set up logging (don't assume it works)
 try:
     logger = logging.getLogger(__name__)
@@ -38,6 +46,28 @@ except Exception:
     logger = FallbackLogger()
 
 
+# Make targets: known safe characters only, at most 100 of them (prevents DoS)
+_COMMAND_RE = re.compile(r'\A[A-Za-z0-9_-]{1,100}\Z')
+
+# Bytes requested per read from a command's output pipes
+_READ_CHUNK_SIZE = 65536
+
+# Seconds of quiet output after which a partial batch is delivered
+_BATCH_INTERVAL = 0.01
+
+# Seconds verify_system_health reuses its filesystem probes
+_HEALTH_CACHE_TTL = 1.0
+
+# Target definitions at the start of a Makefile line ("name:")
+_TARGET_RE = re.compile(r'^([A-Za-z0-9_.-]+):', re.MULTILINE)
+
+
+@lru_cache(maxsize=128)
+def _compile_verify(pattern: str) -> re.Pattern:
+    """Compile a verify_output pattern (cached; callers reuse fixed patterns)."""
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+
 @dataclass
 class ZeroTrustExecutionResult:
     """Result of a zero trust command execution.
@@ -82,21 +112,23 @@ class ZeroTrustExecutionResult:
         )
 
 
-@dataclass
 class CommandState:
-    """State of a running command - never assume it's valid."""
-    command: str
-    running: bool
-    pid: Optional[int]
-    started_at: Optional[datetime]
-    process: Optional[subprocess.Popen]
+    """State of a running command - never assume it's valid.
+    
+    There is deliberately no 'running' flag or pid: the process itself is
+    the only source of truth (pid is available as process.pid).
+    """
+    __slots__ = ('command', 'started_at', 'process')
+    
+    def __init__(self, command: str, started_at: Optional[datetime] = None,
+                 process: Optional[subprocess.Popen] = None):
+        self.command = command
+        self.started_at = started_at
+        self.process = process
     
     def is_actually_running(self) -> bool:
-        """Verify the process is actually running.
-        
-        Don't trust the 'running' flag - check the actual process.
-        """
-        if not self.running or self.process is None:
+        """Verify the process is actually running."""
+        if self.process is None:
             return False
         
         try:
@@ -118,12 +150,14 @@ class ZeroTrustCommandExecutor:
     - Provide detailed failure information
     """
     
-    def __init__(self, ahab_path: str, timeout: int = 3600):
+    def __init__(self, ahab_path: str, timeout: int = 3600, merge_stderr: bool = True):
         """Initialize the zero trust command executor.
         
         Args:
             ahab_path: Path to the ahab directory containing Makefile
             timeout: Default timeout for commands in seconds
+            merge_stderr: Send stderr into the output stream (one pipe);
+                set False to capture it separately in error_output
             
         Raises:
             ValueError: If ahab_path is invalid or inaccessible
@@ -133,14 +167,16 @@ class ZeroTrustCommandExecutor:
             raise ValueError("ahab_path must be a non-empty string")
         
         self.ahab_path = Path(ahab_path)
+        # Plain string paths for the per-execute checks (no Path churn)
+        self._ahab_path_str = str(self.ahab_path)
+        self._makefile_str = os.path.join(self._ahab_path_str, 'Makefile')
         
         # Verify path exists and is accessible
-        if not self._verify_path_accessible(self.ahab_path):
+        if not self._verify_path_accessible(self._ahab_path_str):
             raise ValueError(f"Ahab path does not exist or is not accessible: {ahab_path}")
         
         # Verify Makefile exists
-        makefile = self.ahab_path / 'Makefile'
-        if not self._verify_file_accessible(makefile):
+        if not self._verify_file_accessible(self._makefile_str):
             raise ValueError(f"Makefile not found or not accessible in: {ahab_path}")
         
         # Validate timeout
@@ -148,27 +184,35 @@ class ZeroTrustCommandExecutor:
             raise ValueError("timeout must be a positive integer")
         
         self.timeout = timeout
+        self.merge_stderr = merge_stderr
         self._running_commands: Dict[str, CommandState] = {}
         self._lock = threading.Lock()
         
+        # Makefile targets, keyed by the Makefile's (mtime, size) when parsed
+        self._targets_cache: Optional[tuple] = None
+        
+        # (checked_at, ahab_path_ok, makefile_ok) from the last health check
+        self._health_cache = (float('-inf'), False, False)
+        
         # State tracking for debugging
-        self._execution_history: List[Dict[str, Any]] = []
         self._max_history = 100  # Prevent memory leaks
+        self._execution_history: Deque[Dict[str, Any]] = deque(maxlen=self._max_history)
         
         logger.info(f"ZeroTrustCommandExecutor initialized: {ahab_path}, timeout={timeout}")
     
-    def _verify_path_accessible(self, path: Path) -> bool:
+    def _verify_path_accessible(self, path: str) -> bool:
         """Verify a path exists and is accessible."""
         try:
-            return path.exists() and os.access(str(path), os.R_OK)
+            # access() fails for missing paths, so one call checks both
+            return os.access(path, os.R_OK)
         except Exception as e:
             logger.error(f"Path verification failed: {e}")
             return False
     
-    def _verify_file_accessible(self, file_path: Path) -> bool:
+    def _verify_file_accessible(self, file_path: str) -> bool:
         """Verify a file exists and is readable."""
         try:
-            return file_path.is_file() and os.access(str(file_path), os.R_OK)
+            return os.path.isfile(file_path) and os.access(file_path, os.R_OK)
         except Exception as e:
             logger.error(f"File verification failed: {e}")
             return False
@@ -185,27 +229,28 @@ class ZeroTrustCommandExecutor:
         if not command or not isinstance(command, str):
             return False
         
-        # Whitelist approach - only allow known safe characters
-        if not re.match(r'^[a-zA-Z0-9_-]+$', command):
-            logger.warning(f"Command contains invalid characters: {command}")
-            return False
-        
-        # Check length (prevent DoS)
-        if len(command) > 100:
-            logger.warning(f"Command too long: {len(command)} characters")
+        # Whitelist approach - only allow known safe characters, bounded length
+        if _COMMAND_RE.match(command) is None:
+            logger.warning(f"Command has invalid characters or is too long: {command[:100]}")
             return False
         
         return True
     
     def _verify_makefile_target(self, target: str) -> bool:
-        """Verify that a make target exists in the Makefile."""
+        """Verify that a make target exists in the Makefile.
+        
+        The Makefile is only re-read when its mtime or size changes.
+        """
         try:
-            makefile = self.ahab_path / 'Makefile'
-            with open(makefile, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Look for target definition
-                pattern = f'^{re.escape(target)}:'
-                return bool(re.search(pattern, content, re.MULTILINE))
+            makefile = self._makefile_str
+            stat = os.stat(makefile)
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._targets_cache
+            if cached is None or cached[0] != key:
+                with open(makefile, 'r', encoding='utf-8') as f:
+                    targets = frozenset(_TARGET_RE.findall(f.read()))
+                cached = self._targets_cache = (key, targets)
+            return target in cached[1]
         except Exception as e:
             logger.error(f"Makefile verification failed: {e}")
             return False
@@ -214,7 +259,7 @@ class ZeroTrustCommandExecutor:
         """Record execution for debugging and audit trail."""
         try:
             record = {
-                'timestamp': result.timestamp.isoformat(),
+                'timestamp': result.timestamp,  # Formatted when history is read
                 'command': command,
                 'exit_code': result.exit_code,
                 'duration': result.duration,
@@ -224,11 +269,8 @@ class ZeroTrustCommandExecutor:
                 'warnings_count': len(result.warnings)
             }
             
+            # Bounded deque drops the oldest record (prevents memory leaks)
             self._execution_history.append(record)
-            
-            # Prevent memory leaks
-            if len(self._execution_history) > self._max_history:
-                self._execution_history = self._execution_history[-self._max_history:]
                 
         except Exception as e:
             logger.error(f"Failed to record execution: {e}")
@@ -236,7 +278,8 @@ class ZeroTrustCommandExecutor:
     def execute(self, command: str, 
                 callback: Optional[Callable[[str], None]] = None,
                 verify_output: Optional[str] = None,
-                timeout_override: Optional[int] = None) -> ZeroTrustExecutionResult:
+                timeout_override: Optional[int] = None,
+                batch_callback: Optional[Callable[[List[str]], None]] = None) -> ZeroTrustExecutionResult:
         """Execute a make command with zero trust verification.
         
         Args:
@@ -244,6 +287,9 @@ class ZeroTrustCommandExecutor:
             callback: Optional callback function for streaming output line-by-line
             verify_output: Optional pattern to verify in output
             timeout_override: Optional timeout override for this command
+            batch_callback: Optional callback receiving output lines in batches
+                (up to 32 lines; a partial batch is delivered once output
+                has been quiet for 10 ms)
         
         Returns:
             ZeroTrustExecutionResult with detailed execution information
@@ -270,14 +316,25 @@ class ZeroTrustCommandExecutor:
             timeout_override > 0
         ) else self.timeout
         
-        start_time = time.time()
+        start_time = time.monotonic()
         timestamp = datetime.now()
-        output_lines = []
-        error_lines = []
+        output_buf = bytearray()
+        error_output = ""
         warnings = []
         timeout_occurred = False
         verification_passed = False
         
+        batcher = None
+        if batch_callback:
+            def deliver_batch(lines: List[str]):
+                try:
+                    batch_callback(lines)
+                except Exception as e:
+                    logger.warning(f"Batch callback failed: {e}")
+                    warnings.append(f"Batch callback failed: {e}")
+            
+            batcher = OutputBatcher(deliver_batch, max_lines=32, interval=_BATCH_INTERVAL)
+        
         # Initialize result with failure state (assume failure until proven otherwise)
         result = ZeroTrustExecutionResult(
             command=command,
@@ -293,102 +350,125 @@ class ZeroTrustCommandExecutor:
         )
         
         # Mark command as running
+        state = CommandState(command, started_at=timestamp)
         with self._lock:
-            self._running_commands[command] = CommandState(
-                command=command,
-                running=True,
-                pid=None,
-                started_at=timestamp,
-                process=None
-            )
+            self._running_commands[command] = state
         
         try:
             # Execute make command with explicit arguments
             process = subprocess.Popen(
                 ['make', command],
-                cwd=str(self.ahab_path),
+                cwd=self._ahab_path_str,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True,
+                stderr=subprocess.STDOUT if self.merge_stderr else subprocess.PIPE,
+                bufsize=0,  # Pipes are read directly with os.read
                 # Security: Don't use shell=True
                 shell=False
             )
             
             # Update process info
-            with self._lock:
-                if command in self._running_commands:
-                    self._running_commands[command].pid = process.pid
-                    self._running_commands[command].process = process
+            state.process = process
             
-            # Set up timeout handling
-            def timeout_handler():
-                time.sleep(timeout)
-                if process.poll() is None:  # Still running
+            error_buf = bytearray()
+            
+            def handle_stdout_line(line: str):
+                # CRLF endings and bare-CR progress updates end lines, as
+                # they did when the pipe was read in text mode
+                for part in split_carriage_returns(line):
+                    if batcher:
+                        batcher.add(part)
+                    if not callback:
+                        continue
                     try:
-                        process.terminate()
-                        time.sleep(5)  # Give it time to terminate gracefully
-                        if process.poll() is None:
-                            process.kill()  # Force kill if necessary
+                        callback(part)
                     except Exception as e:
-                        logger.error(f"Failed to terminate process: {e}")
-            
-            timeout_thread = threading.Thread(target=timeout_handler, daemon=True)
-            timeout_thread.start()
+                        logger.warning(f"Callback failed: {e}")
+                        warnings.append(f"Callback failed: {e}")
             
-            # Stream output line by line
-            stdout_lines = []
-            stderr_lines = []
+            deadline = time.monotonic() + timeout
+            stdout_tail = b''
+            if not (callback or batcher):
+                # Nothing to stream: communicate() collects both pipes
+                stdout_data, stderr_data = process.communicate(timeout=timeout)
+                output_buf += stdout_data
+                if stderr_data:
+                    error_buf += stderr_data
+            else:
+                # Drain stdout and stderr (if separate) together so neither
+                # pipe can fill up and stall the command; the deadline bounds
+                # the whole read
+                with selectors.DefaultSelector() as selector:
+                    selector.register(process.stdout, selectors.EVENT_READ, 'stdout')
+                    if process.stderr:
+                        selector.register(process.stderr, selectors.EVENT_READ, 'stderr')
+                    while selector.get_map():
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise subprocess.TimeoutExpired(process.args, timeout)
+                        if batcher:
+                            # Wake up after the batch interval so a partial
+                            # batch goes out once the command goes quiet
+                            events = selector.select(timeout=min(remaining, _BATCH_INTERVAL))
+                            if not events:
+                                batcher.flush()
+                                continue
+                        else:
+                            events = selector.select(timeout=remaining)
+                        for key, _ in events:
+                            chunk = os.read(key.fd, _READ_CHUNK_SIZE)
+                            if not chunk:
+                                selector.unregister(key.fileobj)
+                            elif key.data == 'stderr':
+                                error_buf += chunk
+                            else:
+                                # Output is kept as raw bytes and decoded once
+                                # at the end; only streamed lines are decoded
+                                output_buf += chunk
+                                *lines, stdout_tail = (stdout_tail + chunk).split(b'\n')
+                                for raw in lines:
+                                    handle_stdout_line(raw.decode('utf-8', 'replace'))
             
-            # Read stdout
-            if process.stdout:
-                for line in iter(process.stdout.readline, ''):
-                    if not line:
-                        break
-                    stdout_lines.append(line)
-                    output_lines.append(line)
-                    if callback:
-                        try:
-                            callback(line.rstrip('\n'))
-                        except Exception as e:
-                            logger.warning(f"Callback failed: {e}")
-                            warnings.append(f"Callback failed: {e}")
+            if stdout_tail:
+                handle_stdout_line(stdout_tail.decode('utf-8', 'replace'))
+            if error_buf:
+                error_output = error_buf.decode('utf-8', 'replace')
             
-            # Wait for process to complete
+            # Both pipes are closed, so make is exiting; reap it within
+            # whatever is left of the timeout
             try:
-                process.wait()
-                exit_code = process.returncode
+                exit_code = process.wait(timeout=max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                raise
             except Exception as e:
                 logger.error(f"Process wait failed: {e}")
                 exit_code = None
                 warnings.append(f"Process wait failed: {e}")
             
-            # Read stderr if available
-            if process.stderr:
-                try:
-                    stderr_content = process.stderr.read()
-                    if stderr_content:
-                        stderr_lines.append(stderr_content)
-                        error_lines.append(stderr_content)
-                except Exception as e:
-                    logger.warning(f"Failed to read stderr: {e}")
-                    warnings.append(f"Failed to read stderr: {e}")
-            
             # Check if timeout occurred
             if exit_code is None or exit_code == -15 or exit_code == -9:
                 timeout_occurred = True
                 warnings.append("Command may have been terminated due to timeout")
             
-        except subprocess.TimeoutExpired:
+        except subprocess.TimeoutExpired as e:
             timeout_occurred = True
             exit_code = 124  # Standard timeout exit code
             warnings.append("Command timed out")
             
-            # Kill the process
+            # communicate() hands back what it read before the deadline
+            # (the selector loop has already buffered its output)
+            if e.stdout:
+                output_buf += e.stdout
+            if e.stderr:
+                error_output = e.stderr.decode('utf-8', 'replace')
+            
+            # Stop the process, gracefully first
             try:
-                process.kill()
-                process.wait()
+                process.terminate()
+                try:
+                    process.wait(timeout=5)  # Give it time to terminate gracefully
+                except subprocess.TimeoutExpired:
+                    process.kill()  # Force kill if necessary
+                    process.wait()
             except Exception as e:
                 logger.error(f"Failed to kill timed out process: {e}")
                 warnings.append(f"Failed to kill timed out process: {e}")
@@ -399,17 +479,18 @@ class ZeroTrustCommandExecutor:
             warnings.append(f"Execution error: {e}")
             
         finally:
-            # Mark command as no longer running
-            with self._lock:
-                if command in self._running_commands:
-                    del self._running_commands[command]
+            if batcher:
+                batcher.flush()
+            
+            # Mark command as no longer running (unless kill() already
+            # removed it and the command has been started again since)
+            self._discard_state(command, state)
         
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         
-        # Combine output
-        output = ''.join(output_lines)
-        error_output = ''.join(error_lines)
+        output = normalize_newlines(output_buf.decode('utf-8', 'replace'))
+        error_output = normalize_newlines(error_output)
         
         # Determine success (be conservative)
         success = (
@@ -421,7 +502,7 @@ class ZeroTrustCommandExecutor:
         # Verify output if pattern provided
         if verify_output and success:
             try:
-                if re.search(verify_output, output, re.IGNORECASE | re.MULTILINE):
+                if _compile_verify(verify_output).search(output):
                     verification_passed = True
                 else:
                     verification_passed = False
@@ -455,6 +536,12 @@ class ZeroTrustCommandExecutor:
         
         return result
     
+    def _discard_state(self, command: str, state: CommandState) -> None:
+        """Remove a command's state unless it was replaced in the meantime."""
+        with self._lock:
+            if self._running_commands.get(command) is state:
+                del self._running_commands[command]
+    
     def is_running(self, command: str) -> bool:
         """Check if a command is currently running.
         
@@ -465,18 +552,17 @@ class ZeroTrustCommandExecutor:
             True if command is running, False otherwise
         """
         with self._lock:
-            if command not in self._running_commands:
-                return False
-            
-            state = self._running_commands[command]
-            
-            # Verify the process is actually running
-            if not state.is_actually_running():
-                # Clean up stale state
-                del self._running_commands[command]
-                return False
-            
-            return True
+            state = self._running_commands.get(command)
+        if state is None:
+            return False
+        
+        # Verify the process is actually running (outside the lock)
+        if not state.is_actually_running():
+            # Clean up stale state
+            self._discard_state(command, state)
+            return False
+        
+        return True
     
     def get_running_commands(self) -> List[str]:
         """Get list of currently running commands.
@@ -485,25 +571,25 @@ class ZeroTrustCommandExecutor:
             List of command names that are currently running
         """
         with self._lock:
-            # Verify each command is actually running
-            actually_running = []
-            to_remove = []
-            
-            for command, state in self._running_commands.items():
-                if state.is_actually_running():
-                    actually_running.append(command)
-                else:
-                    to_remove.append(command)
-            
-            # Clean up stale states
-            for command in to_remove:
-                del self._running_commands[command]
-            
-            return actually_running
+            states = list(self._running_commands.items())
+        
+        # Verify each command is actually running (outside the lock),
+        # cleaning up stale states in the same pass
+        actually_running = []
+        for command, state in states:
+            if state.is_actually_running():
+                actually_running.append(command)
+            else:
+                self._discard_state(command, state)
+        
+        return actually_running
     
     def kill(self, command: str) -> bool:
         """Kill a running command.
         
+        The command's state is removed up front, under the lock; the
+        process is then stopped without holding the lock.
+        
         Args:
             command: The make target to kill
         
@@ -511,48 +597,39 @@ class ZeroTrustCommandExecutor:
             True if command was killed, False if not running or kill failed
         """
         with self._lock:
-            if command not in self._running_commands:
-                return False
+            state = self._running_commands.pop(command, None)
+        if state is None or not state.process:
+            return False
+        
+        try:
+            # Try graceful termination first
+            state.process.terminate()
             
-            state = self._running_commands[command]
+            # Wait a bit for graceful shutdown
+            try:
+                state.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                # Force kill if graceful termination failed
+                state.process.kill()
+                state.process.wait()
             
-            if not state.process:
-                # Clean up invalid state
-                del self._running_commands[command]
-                return False
+            logger.info(f"Successfully killed command: {command}")
+            return True
             
-            try:
-                # Try graceful termination first
-                state.process.terminate()
-                
-                # Wait a bit for graceful shutdown
-                try:
-                    state.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    # Force kill if graceful termination failed
-                    state.process.kill()
-                    state.process.wait()
-                
-                # Clean up state
-                del self._running_commands[command]
-                
-                logger.info(f"Successfully killed command: {command}")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to kill command '{command}': {e}")
-                # Clean up state anyway
-                if command in self._running_commands:
-                    del self._running_commands[command]
-                return False
+        except Exception as e:
+            logger.error(f"Failed to kill command '{command}': {e}")
+            return False
     
     def get_execution_history(self) -> List[Dict[str, Any]]:
         """Get execution history for debugging and audit.
         
         Returns:
-            List of execution records
+            List of execution records (timestamps as ISO 8601 strings)
         """
-        return self._execution_history.copy()
+        return [
+            dict(record, timestamp=record['timestamp'].isoformat())
+            for record in self._execution_history
+        ]
     
     def verify_system_health(self) -> Dict[str, Any]:
         """Verify the executor system is healthy.
@@ -560,20 +637,27 @@ class ZeroTrustCommandExecutor:
         Returns:
             Dictionary with health check results
         """
+        # Reuse recent filesystem probes; accessibility does not change at
+        # polling cadence
+        now = time.monotonic()
+        checked_at, path_ok, makefile_ok = self._health_cache
+        if now - checked_at >= _HEALTH_CACHE_TTL:
+            path_ok = self._verify_path_accessible(self._ahab_path_str)
+            makefile_ok = self._verify_file_accessible(self._makefile_str)
+            self._health_cache = (now, path_ok, makefile_ok)
+        
         health = {
-            'ahab_path_accessible': self._verify_path_accessible(self.ahab_path),
-            'makefile_accessible': self._verify_file_accessible(self.ahab_path / 'Makefile'),
+            'ahab_path_accessible': path_ok,
+            'makefile_accessible': makefile_ok,
             'running_commands_count': len(self.get_running_commands()),
             'execution_history_count': len(self._execution_history),
             'timestamp': datetime.now().isoformat()
         }
         
         # Check for stale processes
-        stale_processes = 0
         with self._lock:
-            for state in self._running_commands.values():
-                if not state.is_actually_running():
-                    stale_processes += 1
+            states = list(self._running_commands.values())
+        stale_processes = sum(1 for state in states if not state.is_actually_running())
         
         health['stale_processes'] = stale_processes
         health['healthy'] = (
@@ -585,6 +669,68 @@ class ZeroTrustCommandExecutor:
         return health
 
 
+# Status executors, one per ahab path, reused across get_system_status calls
+_status_executors: Dict[str, ZeroTrustCommandExecutor] = {}
+_status_executors_lock = threading.Lock()
+
+
+def _get_status_executor(ahab_path: str) -> ZeroTrustCommandExecutor:
+    """Get the shared status executor for ahab_path (created on first use)."""
+    executor = _status_executors.get(ahab_path)
+    if executor is None:
+        with _status_executors_lock:
+            executor = _status_executors.get(ahab_path)
+            if executor is None:
+                executor = ZeroTrustCommandExecutor(ahab_path, timeout=30)
+                _status_executors[ahab_path] = executor
+    return executor
+
+
+class _StatusRun:
+    """A make status run that concurrent callers wait on and share."""
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[ZeroTrustExecutionResult] = None
+        self.error: Optional[BaseException] = None
+
+
+# In-flight make status runs, keyed by ahab path
+_status_runs: Dict[str, _StatusRun] = {}
+
+
+def _run_status(ahab_path: str) -> ZeroTrustExecutionResult:
+    """Run make status, or wait for and reuse a run already in flight.
+    
+    The status executor is shared per path and rejects a second concurrent
+    'status', so overlapping callers join the running one instead.
+    """
+    with _status_executors_lock:
+        run = _status_runs.get(ahab_path)
+        leader = run is None
+        if leader:
+            run = _status_runs[ahab_path] = _StatusRun()
+    
+    if not leader:
+        run.done.wait()
+        if run.error is not None:
+            raise run.error
+        return run.result
+    
+    try:
+        run.result = _get_status_executor(ahab_path).execute(
+            'status', verify_output='Status Check Complete')
+        return run.result
+    except BaseException as e:
+        run.error = e
+        raise
+    finally:
+        with _status_executors_lock:
+            del _status_runs[ahab_path]
+        run.done.set()
+
+
 def get_system_status(ahab_path: str) -> Dict[str, Any]:
     """Get current system status using zero trust principles.
     
@@ -604,7 +750,7 @@ def get_system_status(ahab_path: str) -> Dict[str, Any]:
             'last_updated': datetime.now().isoformat()
         }
     
-    ahab_path_obj = Path(ahab_path)
+    vagrant_dir = os.path.join(ahab_path, '.vagrant')
     
     # Initialize status with safe defaults (assume nothing works)
     status = {
@@ -617,55 +763,29 @@ def get_system_status(ahab_path: str) -> Dict[str, Any]:
     }
     
     try:
-        # Create executor to run make status
-        executor = ZeroTrustCommandExecutor(str(ahab_path_obj), timeout=30)
-        
-        # Execute make status command
-        result = executor.execute('status', verify_output='Status Check Complete')
+        # Execute make status command (shared with concurrent callers)
+        result = _run_status(ahab_path)
         
         if result.is_completely_successful():
             # Parse output to determine status
             output = result.output
             
             # Check workstation status
-            if '✓ Workstation: Running' in output:
-                status['workstation_installed'] = True
-                status['workstation_running'] = True
-            elif '⚠ Workstation: Stopped' in output:
-                status['workstation_installed'] = True
-                status['workstation_running'] = False
-            elif '○ Workstation: Not Created' in output:
-                status['workstation_installed'] = False
-                status['workstation_running'] = False
+            workstation = parse_workstation_state(output)
+            if workstation is not None:
+                status['workstation_installed'], status['workstation_running'] = workstation
             else:
                 status['warnings'].append('Could not determine workstation status from output')
             
             # Parse services (look for docker container info)
-            services = []
-            lines = output.split('\n')
-            for line in lines:
-                if 'ahab_' in line and 'Up' in line:
-                    # Extract service name from docker container name
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        container_name = parts[0]
-                        if container_name.startswith('ahab_'):
-                            service_name = container_name.replace('ahab_', '')
-                            services.append({
-                                'name': service_name,
-                                'status': 'running',
-                                'container': container_name
-                            })
-            
-            status['services'] = services
+            status['services'] = parse_running_services(output)
             
         else:
             # Command failed - use fallback detection
             status['errors'].append(f'make status failed: exit_code={result.exit_code}')
             
             # Fallback: check if .vagrant directory exists
-            vagrant_dir = ahab_path_obj / '.vagrant'
-            if vagrant_dir.exists():
+            if os.path.isdir(vagrant_dir):
                 status['workstation_installed'] = True
                 status['warnings'].append('Workstation status detected via .vagrant directory (fallback)')
             
@@ -679,8 +799,7 @@ def get_system_status(ahab_path: str) -> Dict[str, Any]:
         
         # Ultimate fallback: check filesystem
         try:
-            vagrant_dir = ahab_path_obj / '.vagrant'
-            if vagrant_dir.exists():
+            if os.path.isdir(vagrant_dir):
                 status['workstation_installed'] = True
                 status['warnings'].append('Workstation detected via filesystem check (ultimate fallback)')
         except Exception as fallback_error:
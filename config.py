@@ -3,8 +3,12 @@ Configuration module for Ahab GUI.
 Loads and validates all configuration with secure defaults.
 """
 import os
+import stat
+import sys
 import logging
+import threading
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +18,52 @@ class ConfigurationError(Exception):
     pass
 
 
+# Allowed make commands (whitelist); a frozenset of interned strings, since
+# it is only ever used for membership checks
+ALLOWED_COMMANDS = frozenset(sys.intern(command) for command in (
+    'install',
+    'test',
+    'status',
+    'clean',
+    'ssh',
+    'network-switches',
+    'network-switches-version',
+    'network-switches-test'
+))
+_SORTED_ALLOWED_COMMANDS = tuple(sorted(ALLOWED_COMMANDS))
+
+_SESSION_FILE_DIR = Path('/tmp/ahab-gui-sessions')
+_session_dir_ready = False
+
+
+def _ensure_session_dir():
+    """Create the session directory once per process."""
+    global _session_dir_ready
+    if not _session_dir_ready:
+        _SESSION_FILE_DIR.mkdir(parents=True, exist_ok=True)
+        _session_dir_ready = True
+    return _SESSION_FILE_DIR
+
+
 class Config:
     """Application configuration with validation and secure defaults."""
     
+    # Every setting is assigned in _load_configuration; create_app hands them
+    # to Flask through as_mapping(). The name is private so that
+    # config.from_object(), which takes every uppercase attribute, does not
+    # load the tuple itself as a setting.
+    _SETTINGS = (
+        'SECRET_KEY', 'AHAB_PATH', 'WUI_HOST', 'WUI_PORT', 'DEBUG',
+        'SESSION_COOKIE_HTTPONLY', 'SESSION_COOKIE_SECURE', 'SESSION_COOKIE_SAMESITE',
+        'WTF_CSRF_ENABLED', 'WTF_CSRF_TIME_LIMIT',
+        'SESSION_TYPE', 'SESSION_PERMANENT', 'PERMANENT_SESSION_LIFETIME', 'SESSION_FILE_DIR',
+        'RATE_LIMIT', 'RATE_LIMIT_WINDOW', 'COMMAND_TIMEOUT', 'ALLOWED_COMMANDS',
+    )
+    __slots__ = _SETTINGS + ('_mapping',)
+    
     def __init__(self):
         """Initialize configuration and validate all values."""
+        self._mapping = None
         self._load_configuration()
         self._validate_configuration()
         logger.info("Configuration loaded successfully", extra={
@@ -30,21 +75,26 @@ class Config:
     
     def _load_configuration(self):
         """Load configuration from environment variables with secure defaults."""
+        # Read the keys straight from os.environ; copying it would decode
+        # every variable just to look up a handful
+        env = os.environ
+        
         # Flask configuration
-        self.SECRET_KEY = os.environ.get('SECRET_KEY')
+        self.SECRET_KEY = env.get('SECRET_KEY')
         if not self.SECRET_KEY:
             raise ConfigurationError("SECRET_KEY environment variable must be set")
         
         # Ahab path configuration
-        ahab_path = os.environ.get('AHAB_PATH', '../ahab')
-        self.AHAB_PATH = str(Path(ahab_path).resolve())
+        ahab_path = env.get('AHAB_PATH', '../ahab')
+        # abspath only joins with the cwd; resolve() would readlink every component
+        self.AHAB_PATH = os.path.abspath(ahab_path)
         
         # Server configuration
-        self.WUI_HOST = os.environ.get('WUI_HOST', '127.0.0.1')
-        self.WUI_PORT = int(os.environ.get('WUI_PORT', '5000'))
+        self.WUI_HOST = env.get('WUI_HOST', '127.0.0.1')
+        self.WUI_PORT = int(env.get('WUI_PORT', '5000'))
         
         # Environment
-        flask_env = os.environ.get('FLASK_ENV', 'production')
+        flask_env = env.get('FLASK_ENV', 'production')
         self.DEBUG = flask_env == 'development'
         
         # Security configuration
@@ -54,31 +104,22 @@ class Config:
         self.WTF_CSRF_ENABLED = True
         self.WTF_CSRF_TIME_LIMIT = None  # No time limit on CSRF tokens
         
-        # Session configuration
+        # Session configuration (sessions are Flask's signed cookies; SESSION_TYPE
+        # and SESSION_FILE_DIR only apply if server-side sessions are re-enabled)
         self.SESSION_TYPE = 'filesystem'
         self.SESSION_PERMANENT = False
         self.PERMANENT_SESSION_LIFETIME = 1800  # 30 minutes
-        self.SESSION_FILE_DIR = Path('/tmp/ahab-gui-sessions')
-        self.SESSION_FILE_DIR.mkdir(parents=True, exist_ok=True)
+        self.SESSION_FILE_DIR = _ensure_session_dir()
         
         # Rate limiting
-        self.RATE_LIMIT = int(os.environ.get('RATE_LIMIT', '10'))
+        self.RATE_LIMIT = int(env.get('RATE_LIMIT', '10'))
         self.RATE_LIMIT_WINDOW = 60  # 1 minute
         
         # Command execution
-        self.COMMAND_TIMEOUT = int(os.environ.get('COMMAND_TIMEOUT', '300'))
+        self.COMMAND_TIMEOUT = int(env.get('COMMAND_TIMEOUT', '300'))
         
         # Allowed make commands (whitelist)
-        self.ALLOWED_COMMANDS = [
-            'install', 
-            'test', 
-            'status', 
-            'clean', 
-            'ssh',
-            'network-switches',
-            'network-switches-version',
-            'network-switches-test'
-        ]
+        self.ALLOWED_COMMANDS = ALLOWED_COMMANDS
     
     def _validate_configuration(self):
         """Validate all configuration values."""
@@ -87,15 +128,18 @@ class Config:
             raise ConfigurationError("SECRET_KEY must be at least 32 characters")
         
         # Validate Ahab path
-        ahab_path = Path(self.AHAB_PATH)
-        if not ahab_path.exists():
+        # One stat gives both existence and type
+        try:
+            ahab_stat = os.stat(self.AHAB_PATH)
+        except OSError:
             raise ConfigurationError(f"Ahab directory does not exist: {self.AHAB_PATH}")
         
-        if not ahab_path.is_dir():
+        if not stat.S_ISDIR(ahab_stat.st_mode):
             raise ConfigurationError(f"Ahab path is not a directory: {self.AHAB_PATH}")
         
-        makefile_path = ahab_path / 'Makefile'
-        if not makefile_path.exists():
+        try:
+            os.stat(os.path.join(self.AHAB_PATH, 'Makefile'))
+        except OSError:
             raise ConfigurationError(f"Makefile not found in Ahab directory: {self.AHAB_PATH}")
         
         # Validate port
@@ -114,6 +158,12 @@ class Config:
         if not self.DEBUG and self.SESSION_COOKIE_SECURE is False:
             logger.warning("Running in production mode but SESSION_COOKIE_SECURE is False")
     
+    def as_mapping(self):
+        """Get a read-only view of all settings, built on first use."""
+        if self._mapping is None:
+            self._mapping = MappingProxyType({name: getattr(self, name) for name in self._SETTINGS})
+        return self._mapping
+    
     def get_summary(self):
         """Get configuration summary for logging (without sensitive data)."""
         return {
@@ -130,18 +180,37 @@ class Config:
     def get_info(self):
         """Get configuration info (alias for get_summary for backwards compatibility)."""
         info = self.get_summary()
-        info['allowed_commands'] = self.ALLOWED_COMMANDS
+        info['allowed_commands'] = list(_SORTED_ALLOWED_COMMANDS)
         return info
 
 
+# Validated configuration shared by every create_config() caller
+_CONFIG_INSTANCE = None
+_CONFIG_LOCK = threading.Lock()
+
+
 def create_config():
-    """Factory function to create and validate configuration."""
-    try:
-        config = Config()
+    """Factory function to create and validate configuration.
+
+    The validated Config is created once and reused by later calls; use
+    reset_config() to force the environment to be read again.
+    """
+    global _CONFIG_INSTANCE
+    config = _CONFIG_INSTANCE
+    if config is not None:
         return config
-    except ConfigurationError as e:
-        logger.error(f"Configuration validation failed: {e}")
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error loading configuration: {e}")
-        raise ConfigurationError(f"Failed to load configuration: {e}")
+    with _CONFIG_LOCK:
+        if _CONFIG_INSTANCE is None:
+            try:
+                _CONFIG_INSTANCE = Config()
+            except ConfigurationError as e:
+                logger.error(f"Configuration validation failed: {e}")
+                raise
+        return _CONFIG_INSTANCE
+
+
+def reset_config():
+    """Drop the cached configuration so the next create_config() reloads it."""
+    global _CONFIG_INSTANCE
+    with _CONFIG_LOCK:
+        _CONFIG_INSTANCE = None
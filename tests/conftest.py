@@ -1,32 +1,34 @@
 """Pytest configuration and fixtures for ahab-gui tests."""
 
 import os
+import pytest
+import tempfile
+import shutil
 from pathlib import Path
 
-# Set environment variables BEFORE any imports
-# This must happen at module level, before pytest even starts
-os.environ['SECRET_KEY'] = 'test-secret-key-minimum-32-characters-long-for-testing'
-
 # Calculate ahab path relative to this test file
 # ahab-gui/tests/conftest.py -> ../../ahab
 test_file_path = Path(__file__).resolve()
-ahab_path = test_file_path.parent.parent.parent / 'ahab'
-os.environ['AHAB_PATH'] = str(ahab_path.resolve())
+default_ahab_path = test_file_path.parent.parent.parent / 'ahab'
 
-os.environ['WUI_HOST'] = '127.0.0.1'
-os.environ['WUI_PORT'] = '5000'
-os.environ['DEBUG'] = 'true'
-import pytest
-import tempfile
-import shutil
-from pathlib import Path
 
-@pytest.fixture
-def temp_ahab_dir():
-    """Create a temporary ahab directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    ahab_dir = Path(temp_dir) / 'ahab'
-    ahab_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture(scope='session', autouse=True)
+def test_environment():
+    """Set the environment variables the app needs for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('SECRET_KEY', 'test-secret-key-minimum-32-characters-long-for-testing')
+        mp.setenv('AHAB_PATH', str(default_ahab_path.resolve()))
+        mp.setenv('WUI_HOST', '127.0.0.1')
+        mp.setenv('WUI_PORT', '5000')
+        mp.setenv('DEBUG', 'true')
+        yield
+
+@pytest.fixture(scope='session')
+def ahab_template_dir(tmp_path_factory):
+    """Build the temporary ahab tree once; it is every test's default AHAB_PATH."""
+    temp_dir = tmp_path_factory.mktemp('ahab-template')
+    ahab_dir = temp_dir / 'ahab'
+    ahab_dir.mkdir()
     
     # Create minimal required structure
     (ahab_dir / 'Makefile').write_text("""
@@ -42,14 +44,8 @@ clean:
 """)
     
     # Create required directories
-    (ahab_dir / 'scripts').mkdir(exist_ok=True)
-    (ahab_dir / 'scripts' / 'lib').mkdir(exist_ok=True)
-    (ahab_dir / 'tests').mkdir(exist_ok=True)
-    (ahab_dir / 'playbooks').mkdir(exist_ok=True)
-    (ahab_dir / 'roles').mkdir(exist_ok=True)
-    (ahab_dir / 'docs').mkdir(exist_ok=True)
-    (ahab_dir / 'config').mkdir(exist_ok=True)
-    (ahab_dir / 'inventory').mkdir(exist_ok=True)
+    for subdir in ('scripts/lib', 'tests', 'playbooks', 'roles', 'docs', 'config', 'inventory'):
+        (ahab_dir / subdir).mkdir(parents=True)
     
     # Create essential files that tests expect
     (ahab_dir / 'README.md').write_text("# Test Ahab\nTest README")
@@ -76,7 +72,7 @@ function check_command() { command -v "$1" >/dev/null 2>&1; }
     (ahab_dir / 'docs' / 'PRODUCTION_SETUP.md').write_text("# Production Setup\nTest production documentation")
     
     # Create ahab.conf in parent directory (config manager expects it there)
-    (Path(temp_dir) / 'ahab.conf').write_text("""# Test configuration
+    (temp_dir / 'ahab.conf').write_text("""# Test configuration
 DEFAULT_OS=fedora
 FEDORA_VERSION=43
 GITHUB_USER=test-user
@@ -84,28 +80,78 @@ WORKSTATION_MEMORY=4096
 WORKSTATION_CPUS=2
 """)
     
-    yield ahab_dir
+    return temp_dir
+
+
+@pytest.fixture(scope='session')
+def ahab_config(ahab_template_dir):
+    """Config for the session's template ahab tree, validated once."""
+    from config import Config
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('AHAB_PATH', str(ahab_template_dir / 'ahab'))
+        return Config()
+
+
+@pytest.fixture(scope='session')
+def ahab_path(ahab_config):
+    """Path to the ahab tree described by ahab_config."""
+    return Path(ahab_config.AHAB_PATH)
+
+
+@pytest.fixture(scope='session')
+def ahab_entries(ahab_path):
+    """DirEntry for each path the prerequisite tests check, keyed by relative path.
+    
+    One scandir per directory replaces a stat per probe; DirEntry.is_dir()
+    and is_file() answer from the cached entry type.
+    """
+    entries = {}
+    for subdir in ('', 'scripts', 'scripts/lib', 'playbooks', 'docs'):
+        try:
+            with os.scandir(ahab_path / subdir) as it:
+                for entry in it:
+                    entries[f'{subdir}/{entry.name}' if subdir else entry.name] = entry
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    return entries
+
+
+@pytest.fixture(scope='session')
+def makefile_text(ahab_path):
+    """Contents of the ahab Makefile, read once."""
+    return (ahab_path / 'Makefile').read_text()
+
+
+@pytest.fixture(scope='session')
+def common_sh_text(ahab_path):
+    """Contents of the ahab common shell library, read once."""
+    return (ahab_path / 'scripts' / 'lib' / 'common.sh').read_text()
+
+
+@pytest.fixture
+def temp_ahab_dir(ahab_template_dir):
+    """Create a private, writable copy of the ahab tree.
+    
+    Only for tests that change files (such as the Makefile) or need a path
+    no other test has used; everything else reads the shared ahab_path.
+    """
+    temp_dir = tempfile.mkdtemp()
+    shutil.copytree(ahab_template_dir, temp_dir, dirs_exist_ok=True)
+    
+    yield Path(temp_dir) / 'ahab'
     
     # Cleanup
     shutil.rmtree(temp_dir)
 
 @pytest.fixture(autouse=True)
-def setup_test_environment(temp_ahab_dir):
+def setup_test_environment(test_environment, ahab_path, monkeypatch):
     """Automatically set up test environment for all tests."""
-    # Override AHAB_PATH for tests
-    original_path = os.environ.get('AHAB_PATH')
-    os.environ['AHAB_PATH'] = str(temp_ahab_dir)
-    
-    yield
-    
-    # Restore original path
-    if original_path:
-        os.environ['AHAB_PATH'] = original_path
-    else:
-        os.environ.pop('AHAB_PATH', None)
+    # Point AHAB_PATH at the session's template tree; monkeypatch restores
+    # it afterwards
+    monkeypatch.setenv('AHAB_PATH', str(ahab_path))
 
 @pytest.fixture
-def app():
+def app(setup_test_environment):
     """Create Flask app for testing."""
     # Import here to avoid circular imports
     from app import create_app
@@ -6,126 +6,107 @@ Since ahab is a prerequisite for ahab-gui, these tests verify the dependency.
 """
 
 import os
+import re
 import pytest
 from pathlib import Path
 from config import Config, ConfigurationError
 
+# "target:" rules and ".PHONY: a b c" declarations
+_MAKE_TARGET_RE = re.compile(r'^(?:\.PHONY:([^\n]*)|([A-Za-z0-9_.-]+):)', re.M)
+# "function name" and "name()" shell function definitions
+_SHELL_FUNCTION_RE = re.compile(r'^[ \t]*(?:function[ \t]+([\w-]+)|([\w-]+)[ \t]*\(\))', re.M)
+
 
 class TestAhabPrerequisite:
     """Test suite for ahab prerequisite verification."""
     
-    def test_ahab_directory_exists(self):
+    def test_ahab_directory_exists(self, ahab_config, ahab_path):
         """Test that ahab directory exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        
-        assert ahab_path.exists(), f"Ahab directory not found at {config.AHAB_PATH}"
-        assert ahab_path.is_dir(), f"Ahab path is not a directory: {config.AHAB_PATH}"
+        assert ahab_path.exists(), f"Ahab directory not found at {ahab_config.AHAB_PATH}"
+        assert ahab_path.is_dir(), f"Ahab path is not a directory: {ahab_config.AHAB_PATH}"
     
-    def test_ahab_makefile_exists(self):
+    def test_ahab_makefile_exists(self, ahab_path, ahab_entries):
         """Test that ahab Makefile exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        makefile = ahab_path / 'Makefile'
+        makefile = ahab_entries.get('Makefile')
         
-        assert makefile.exists(), f"Makefile not found in ahab directory: {makefile}"
-        assert makefile.is_file(), f"Makefile is not a file: {makefile}"
+        assert makefile is not None, f"Makefile not found: {ahab_path / 'Makefile'}"
+        assert makefile.is_file(), f"Makefile is not a file: {makefile.path}"
     
-    def test_ahab_makefile_has_targets(self):
+    def test_ahab_makefile_has_targets(self, makefile_text):
         """Test that ahab Makefile contains expected targets."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        makefile = ahab_path / 'Makefile'
-        
-        content = makefile.read_text()
+        # Rule names and .PHONY declarations, collected in one pass
+        targets_found = set()
+        for phony, rule in _MAKE_TARGET_RE.findall(makefile_text):
+            targets_found.update(phony.split() if phony else (rule,))
         
         # Check for essential make targets
-        expected_targets = ['install', 'test', 'clean', 'help']
-        for target in expected_targets:
-            assert f'{target}:' in content or f'.PHONY: {target}' in content, \
-                f"Makefile missing expected target: {target}"
+        expected_targets = {'install', 'test', 'clean', 'help'}
+        missing_targets = expected_targets - targets_found
+        assert not missing_targets, \
+            f"Makefile missing expected targets: {', '.join(sorted(missing_targets))}"
     
-    def test_ahab_playbooks_directory_exists(self):
+    def test_ahab_playbooks_directory_exists(self, ahab_path, ahab_entries):
         """Test that ahab playbooks directory exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        playbooks_dir = ahab_path / 'playbooks'
+        playbooks_dir = ahab_entries.get('playbooks')
         
-        assert playbooks_dir.exists(), f"Playbooks directory not found: {playbooks_dir}"
-        assert playbooks_dir.is_dir(), f"Playbooks path is not a directory: {playbooks_dir}"
+        assert playbooks_dir is not None, f"Playbooks directory not found: {ahab_path / 'playbooks'}"
+        assert playbooks_dir.is_dir(), f"Playbooks path is not a directory: {playbooks_dir.path}"
     
-    def test_ahab_roles_directory_exists(self):
+    def test_ahab_roles_directory_exists(self, ahab_path, ahab_entries):
         """Test that ahab roles directory exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        roles_dir = ahab_path / 'roles'
+        roles_dir = ahab_entries.get('roles')
         
-        assert roles_dir.exists(), f"Roles directory not found: {roles_dir}"
-        assert roles_dir.is_dir(), f"Roles path is not a directory: {roles_dir}"
+        assert roles_dir is not None, f"Roles directory not found: {ahab_path / 'roles'}"
+        assert roles_dir.is_dir(), f"Roles path is not a directory: {roles_dir.path}"
     
-    def test_ahab_scripts_directory_exists(self):
+    def test_ahab_scripts_directory_exists(self, ahab_path, ahab_entries):
         """Test that ahab scripts directory exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        scripts_dir = ahab_path / 'scripts'
+        scripts_dir = ahab_entries.get('scripts')
         
-        assert scripts_dir.exists(), f"Scripts directory not found: {scripts_dir}"
-        assert scripts_dir.is_dir(), f"Scripts path is not a directory: {scripts_dir}"
+        assert scripts_dir is not None, f"Scripts directory not found: {ahab_path / 'scripts'}"
+        assert scripts_dir.is_dir(), f"Scripts path is not a directory: {scripts_dir.path}"
     
-    def test_ahab_common_library_exists(self):
+    def test_ahab_common_library_exists(self, ahab_path, ahab_entries):
         """Test that ahab common shell library exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        common_lib = ahab_path / 'scripts' / 'lib' / 'common.sh'
+        common_lib = ahab_entries.get('scripts/lib/common.sh')
         
-        assert common_lib.exists(), f"Common library not found: {common_lib}"
-        assert common_lib.is_file(), f"Common library is not a file: {common_lib}"
+        assert common_lib is not None, f"Common library not found: {ahab_path / 'scripts/lib/common.sh'}"
+        assert common_lib.is_file(), f"Common library is not a file: {common_lib.path}"
     
-    def test_ahab_common_library_has_functions(self):
+    def test_ahab_common_library_has_functions(self, common_sh_text):
         """Test that ahab common library contains expected functions."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        common_lib = ahab_path / 'scripts' / 'lib' / 'common.sh'
-        
-        content = common_lib.read_text()
+        functions_found = {name for pair in _SHELL_FUNCTION_RE.findall(common_sh_text) for name in pair if name}
         
         # Check for essential functions that ahab-gui might use
-        expected_functions = [
+        expected_functions = {
             'print_success',
             'print_error',
             'print_info',
             'print_warning',
             'validate_input',
             'check_command'
-        ]
+        }
         
-        for func in expected_functions:
-            assert f'{func}()' in content or f'function {func}' in content, \
-                f"Common library missing expected function: {func}"
+        missing_functions = expected_functions - functions_found
+        assert not missing_functions, \
+            f"Common library missing expected functions: {', '.join(sorted(missing_functions))}"
     
-    def test_ahab_tests_directory_exists(self):
+    def test_ahab_tests_directory_exists(self, ahab_path, ahab_entries):
         """Test that ahab tests directory exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        tests_dir = ahab_path / 'tests'
+        tests_dir = ahab_entries.get('tests')
         
-        assert tests_dir.exists(), f"Tests directory not found: {tests_dir}"
-        assert tests_dir.is_dir(), f"Tests path is not a directory: {tests_dir}"
+        assert tests_dir is not None, f"Tests directory not found: {ahab_path / 'tests'}"
+        assert tests_dir.is_dir(), f"Tests path is not a directory: {tests_dir.path}"
     
-    def test_ahab_docs_directory_exists(self):
+    def test_ahab_docs_directory_exists(self, ahab_path, ahab_entries):
         """Test that ahab docs directory exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        docs_dir = ahab_path / 'docs'
+        docs_dir = ahab_entries.get('docs')
         
-        assert docs_dir.exists(), f"Docs directory not found: {docs_dir}"
-        assert docs_dir.is_dir(), f"Docs path is not a directory: {docs_dir}"
+        assert docs_dir is not None, f"Docs directory not found: {ahab_path / 'docs'}"
+        assert docs_dir.is_dir(), f"Docs path is not a directory: {docs_dir.path}"
     
-    def test_ahab_structure_complete(self):
+    def test_ahab_structure_complete(self, ahab_entries):
         """Test that ahab has complete directory structure."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        
         # All essential directories
         essential_dirs = [
             'playbooks',
@@ -138,20 +119,13 @@ class TestAhabPrerequisite:
             'inventory'
         ]
         
-        missing_dirs = []
-        for dir_name in essential_dirs:
-            dir_path = ahab_path / dir_name
-            if not dir_path.exists():
-                missing_dirs.append(dir_name)
+        missing_dirs = [dir_name for dir_name in essential_dirs if dir_name not in ahab_entries]
         
         assert len(missing_dirs) == 0, \
             f"Ahab missing essential directories: {', '.join(missing_dirs)}"
     
-    def test_ahab_essential_files_exist(self):
+    def test_ahab_essential_files_exist(self, ahab_entries):
         """Test that ahab has essential files."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        
         # All essential files
         essential_files = [
             'Makefile',
@@ -160,33 +134,21 @@ class TestAhabPrerequisite:
             'playbooks/provision-workstation.yml'
         ]
         
-        missing_files = []
-        for file_name in essential_files:
-            file_path = ahab_path / file_name
-            if not file_path.exists():
-                missing_files.append(file_name)
+        missing_files = [file_name for file_name in essential_files if file_name not in ahab_entries]
         
         assert len(missing_files) == 0, \
             f"Ahab missing essential files: {', '.join(missing_files)}"
     
-    def test_ahab_path_is_absolute(self):
+    def test_ahab_path_is_absolute(self, ahab_config, ahab_path):
         """Test that AHAB_PATH is an absolute path."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        
         assert ahab_path.is_absolute(), \
-            f"AHAB_PATH should be absolute, got: {config.AHAB_PATH}"
+            f"AHAB_PATH should be absolute, got: {ahab_config.AHAB_PATH}"
     
-    def test_ahab_path_is_readable(self):
+    def test_ahab_path_is_readable(self, ahab_config):
         """Test that ahab directory is readable."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        
-        # Try to list directory contents
-        try:
-            list(ahab_path.iterdir())
-        except PermissionError:
-            pytest.fail(f"Cannot read ahab directory: {config.AHAB_PATH}")
+        # Listing needs read and search permission on the directory
+        assert os.access(ahab_config.AHAB_PATH, os.R_OK | os.X_OK), \
+            f"Cannot read ahab directory: {ahab_config.AHAB_PATH}"
     
     def test_config_validates_ahab_path(self):
         """Test that Config validates ahab path on initialization."""
@@ -221,37 +183,21 @@ class TestAhabPrerequisite:
 class TestAhabIntegration:
     """Test suite for ahab-gui integration with ahab."""
     
-    def test_can_construct_make_command_path(self):
+    def test_can_construct_make_command_path(self, ahab_entries):
         """Test that we can construct path to make command."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        makefile = ahab_path / 'Makefile'
-        
         # Verify we can construct command
-        assert makefile.exists()
+        assert 'Makefile' in ahab_entries
         
-        # This is how executor would call make
+        # The executor runs make from PATH, so finding it is enough here;
+        # test_ahab_makefile_help_target_works actually invokes it
         # Skip if make not available (e.g., in Docker container)
-        import subprocess
         import shutil
         
         if not shutil.which('make'):
             pytest.skip("Make not available in this environment (expected in Docker)")
-        
-        result = subprocess.run(
-            ['make', '--version'],
-            cwd=str(ahab_path),
-            capture_output=True,
-            text=True
-        )
-        
-        assert result.returncode == 0, "Make command should be available"
     
-    def test_ahab_makefile_help_target_works(self):
+    def test_ahab_makefile_help_target_works(self, ahab_path):
         """Test that ahab Makefile help target works."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        
         import subprocess
         import shutil
         
@@ -272,10 +218,8 @@ class TestAhabIntegration:
         assert result.returncode in [0, 2], \
             f"Make help failed with unexpected code: {result.returncode}"
     
-    def test_ahab_path_relative_to_gui(self):
+    def test_ahab_path_relative_to_gui(self, ahab_path):
         """Test that ahab path is correctly relative to ahab-gui."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
         gui_path = Path(__file__).parent.parent  # ahab-gui directory
         
         # Ahab should be sibling to ahab-gui (both in same parent)
@@ -304,35 +248,24 @@ class TestAhabIntegration:
 class TestAhabDocumentation:
     """Test suite for ahab documentation presence."""
     
-    def test_ahab_readme_exists(self):
+    def test_ahab_readme_exists(self, ahab_path, ahab_entries):
         """Test that ahab README exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        readme = ahab_path / 'README.md'
-        
-        assert readme.exists(), f"README.md not found: {readme}"
+        assert 'README.md' in ahab_entries, \
+            f"README.md not found: {ahab_path / 'README.md'}"
     
-    def test_ahab_security_model_exists(self):
+    def test_ahab_security_model_exists(self, ahab_path, ahab_entries):
         """Test that ahab security model documentation exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        security_doc = ahab_path / 'docs' / 'SECURITY_MODEL.md'
-        
-        assert security_doc.exists(), \
-            f"Security model documentation not found: {security_doc}"
+        assert 'docs/SECURITY_MODEL.md' in ahab_entries, \
+            f"Security model documentation not found: {ahab_path / 'docs/SECURITY_MODEL.md'}"
     
-    def test_ahab_production_setup_exists(self):
+    def test_ahab_production_setup_exists(self, ahab_path, ahab_entries):
         """Test that ahab production setup documentation exists."""
-        config = Config()
-        ahab_path = Path(config.AHAB_PATH)
-        prod_setup = ahab_path / 'docs' / 'PRODUCTION_SETUP.md'
-        
-        assert prod_setup.exists(), \
-            f"Production setup documentation not found: {prod_setup}"
+        assert 'docs/PRODUCTION_SETUP.md' in ahab_entries, \
+            f"Production setup documentation not found: {ahab_path / 'docs/PRODUCTION_SETUP.md'}"
 
 
 # Summary test that runs all checks
-def test_ahab_prerequisite_complete():
+def test_ahab_prerequisite_complete(ahab_entries):
     """
     Comprehensive test that ahab prerequisite is complete and intact.
     
@@ -344,14 +277,9 @@ def test_ahab_prerequisite_complete():
     - Documentation is present
     - Integration points work
     """
-    config = Config()
-    ahab_path = Path(config.AHAB_PATH)
-    
-    # Quick checks
-    assert ahab_path.exists(), "Ahab directory must exist"
-    assert (ahab_path / 'Makefile').exists(), "Makefile must exist"
-    assert (ahab_path / 'scripts' / 'lib' / 'common.sh').exists(), \
+    # Quick checks against the shared scan; the granular tests above
+    # report the details
+    assert ahab_entries, "Ahab directory must exist"
+    assert 'Makefile' in ahab_entries, "Makefile must exist"
+    assert 'scripts/lib/common.sh' in ahab_entries, \
         "Common library must exist"
-    
-    # If we get here, ahab prerequisite is satisfied
-    assert True, "Ahab prerequisite is complete and intact"
@@ -49,3 +49,220 @@ def test_requirements_file_exists():
 def test_readme_exists():
     """Test that README.md exists."""
     assert Path('README.md').exists()
+
+
+def test_navigation_marks_current_section():
+    """Test that pages highlight their top-level nav item."""
+    from app import _nav_for_endpoint
+    
+    current = [item['label'] for item in _nav_for_endpoint('network_switches') if item['is_current']]
+    assert current == ['Network']
+    
+    current = [item['label'] for item in _nav_for_endpoint('index') if item['is_current']]
+    assert current == ['Home']
+    
+    assert not any(item['is_current'] for item in _nav_for_endpoint(None))
+
+
+def test_breadcrumbs_follow_path():
+    """Test that breadcrumbs are built from the request path."""
+    from app import _build_breadcrumbs
+    
+    assert _build_breadcrumbs('/') == ()
+    
+    crumbs = _build_breadcrumbs('/network/switches')
+    assert [c['label'] for c in crumbs] == ['Home', 'Network', 'Switches']
+    assert [c['url'] for c in crumbs] == ['/', '/network', '/network/switches']
+    assert [c['is_current'] for c in crumbs] == [False, False, True]
+
+
+def test_now_iso_second_resolution():
+    """Test status timestamps are ISO formatted at second resolution."""
+    from datetime import datetime
+    from app import _now_iso
+    
+    stamp = _now_iso()
+    assert datetime.fromisoformat(stamp).microsecond == 0
+
+
+def test_whitelist_api(client):
+    """Test whitelist endpoint returns cacheable JSON."""
+    response = client.get('/api/whitelist')
+    assert response.status_code == 200
+    assert response.is_json
+    assert 'public' in response.headers['Cache-Control']
+    
+    data = response.get_json()
+    assert 'install' in data['commands']
+    assert data['services'] == ['apache', 'mysql', 'php']
+
+
+def test_security_headers_set(client):
+    """Test security headers are added to responses."""
+    response = client.get('/help')
+    assert response.headers['X-Content-Type-Options'] == 'nosniff'
+    assert response.headers['X-Frame-Options'] == 'DENY'
+    assert "default-src 'self'" in response.headers['Content-Security-Policy']
+
+
+def test_static_files_skip_page_security_headers(client):
+    """Test static assets only get the nosniff header."""
+    response = client.get('/static/css/style.css')
+    assert response.status_code == 200
+    assert response.headers['X-Content-Type-Options'] == 'nosniff'
+    assert 'Content-Security-Policy' not in response.headers
+    response.close()
+
+
+def test_json_provider_serializes_datetimes(app):
+    """Test API JSON encodes datetimes as ISO 8601 strings."""
+    from datetime import datetime
+    
+    moment = datetime(2025, 12, 10, 8, 30, 15, 250000)
+    with app.app_context():
+        from flask import json
+        assert json.dumps({'at': moment}) == '{"at":"2025-12-10T08:30:15.250000"}'
+        assert json.loads(b'{"command": "test"}') == {'command': 'test'}
+
+
+def test_status_display_states():
+    """Test precomputed status display fields match system state."""
+    from app import _SERVICE_STATES, _WORKSTATION_STATES
+    
+    assert _WORKSTATION_STATES[(True, True)]['status_value'] == 'Running'
+    assert _WORKSTATION_STATES[(True, False)]['status_type'] == 'warning'
+    assert _WORKSTATION_STATES[(False, False)]['status_value'] == 'Not Installed'
+    
+    assert _SERVICE_STATES[('mysql', True)]['description'] == 'Mysql service is operational'
+    assert _SERVICE_STATES[('nginx', False)]['status_type'] == 'info'
+
+
+def test_execute_rejects_unknown_command(client):
+    """Test execute endpoint rejects commands outside the whitelist."""
+    response = client.post('/api/execute', json={'command': 'rm-rf'})
+    assert response.status_code == 400
+    
+    data = response.get_json()
+    assert data['code'] == 'COMMAND_NOT_ALLOWED'
+    assert 'install' in data['allowed_commands']
+    
+    for command in (['install'], {'name': 'install'}):
+        response = client.post('/api/execute', json={'command': command})
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'COMMAND_NOT_ALLOWED'
+
+
+def test_execute_missing_command(client):
+    """Test execute endpoint reports a missing command parameter."""
+    response = client.post('/api/execute', data=b'', headers={'Accept': 'application/json'})
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'MISSING_COMMAND'
+
+
+def test_execute_malformed_json(client):
+    """Test malformed JSON bodies are rejected as bad requests."""
+    response = client.post('/api/execute', data=b'{not json',
+                           headers={'Accept': 'application/json'})
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'BAD_REQUEST'
+
+
+def test_error_format_follows_each_request(client):
+    """Test that a JSON error response does not carry over to the next request."""
+    response = client.get('/nope', headers={'Accept': 'application/json'})
+    assert response.status_code == 404
+    assert response.mimetype == 'application/json'
+
+    response = client.get('/nope2')
+    assert response.status_code == 404
+    assert response.mimetype == 'text/html'
+
+
+def test_service_action_routes(client):
+    """Test service actions are validated at routing time."""
+    response = client.post('/services/mysql/restart')
+    assert response.status_code == 200
+    assert response.get_json()['message'] == 'mysql restarted successfully'
+    
+    response = client.post('/services/invalid/install', headers={'Accept': 'application/json'})
+    assert response.status_code == 404
+    
+    response = client.post('/services/apache/explode', headers={'Accept': 'application/json'})
+    assert response.status_code == 404
+
+
+def test_switches_invalid_environment(client):
+    """Test switches endpoints reject unknown environments."""
+    response = client.post('/api/network/switches/version', json={'environment': 'staging'})
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INVALID_ENVIRONMENT'
+    
+    response = client.post('/api/network/switches/version', json={'environment': ['dev']})
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INVALID_ENVIRONMENT'
+    
+    # A switch command never runs without a JSON object body
+    for body in (b'', b'not json', b'["dev"]'):
+        response = client.post('/api/network/switches/version', data=body,
+                               headers={'Accept': 'application/json'})
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'BAD_REQUEST'
+    
+    response = client.post('/api/network/switches/reboot', json={'environment': 'dev'},
+                           headers={'Accept': 'application/json'})
+    assert response.status_code == 404
+
+
+def test_execute_plain_text_output(client, ahab_path, monkeypatch):
+    """Test execute returns the raw log to plain-text clients."""
+    import app as app_module
+    # The shared config may still point at an earlier test's ahab dir
+    monkeypatch.setattr(app_module.get_config(), 'AHAB_PATH', str(ahab_path))
+    
+    response = client.post('/api/execute', json={'command': 'test'},
+                           headers={'Accept': 'text/plain'})
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    assert response.headers['X-Exit-Code'] == '0'
+    assert response.get_data(as_text=True) == 'Running tests\n'
+
+
+def test_status_without_make_on_path(client, temp_ahab_dir, monkeypatch):
+    """Test the status endpoint still answers when make is not installed."""
+    import shutil
+    import app as app_module
+    # The shared config may still point at an earlier test's ahab dir
+    monkeypatch.setattr(app_module.get_config(), 'AHAB_PATH', str(temp_ahab_dir))
+    monkeypatch.setattr(shutil, 'which', lambda name: None)
+    response = client.get('/api/status')
+    assert response.status_code == 200
+    assert response.get_json()['running_commands'] == []
+
+
+def test_concurrent_first_requests_share_one_executor(app, ahab_path, monkeypatch):
+    """Test that simultaneous first requests build a single executor."""
+    import threading
+    import time
+    import app as app_module
+    created = []
+
+    class SlowExecutor(app_module.CommandExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            time.sleep(0.2)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(app_module, 'CommandExecutor', SlowExecutor)
+    monkeypatch.setattr(app_module, 'get_system_status', lambda path: {})
+    monkeypatch.setattr(app_module.get_config(), 'AHAB_PATH', str(ahab_path))
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(app.test_client().get('/api/status')))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert len(created) == 1
+    assert app.extensions['executor'] is created[0]
@@ -3,7 +3,7 @@
 import os
 import pytest
 from pathlib import Path
-from config import Config, ConfigurationError
+from config import Config, ConfigurationError, create_config, reset_config
 
 
 def test_config_defaults():
@@ -15,9 +15,9 @@ def test_config_defaults():
 
 
 def test_config_allowed_commands():
-    """Test that allowed commands list is defined."""
+    """Test that allowed commands whitelist is defined."""
     config = Config()
-    assert isinstance(config.ALLOWED_COMMANDS, list)
+    assert isinstance(config.ALLOWED_COMMANDS, frozenset)
     assert len(config.ALLOWED_COMMANDS) > 0
     assert 'install' in config.ALLOWED_COMMANDS
     assert 'test' in config.ALLOWED_COMMANDS
@@ -47,3 +47,38 @@ def test_session_directory_created():
     config = Config()
     assert config.SESSION_FILE_DIR.exists()
     assert config.SESSION_FILE_DIR.is_dir()
+
+
+def test_create_config_is_cached():
+    """Test that create_config reuses the validated configuration."""
+    reset_config()
+    try:
+        config = create_config()
+        assert create_config() is config
+        reset_config()
+        assert create_config() is not config
+    finally:
+        reset_config()
+
+
+def test_config_is_slotted():
+    """Test that Config keeps settings in slots and still loads into Flask."""
+    from flask import Flask
+    config = Config()
+    assert not hasattr(config, '__dict__')
+    app = Flask(__name__)
+    app.config.from_object(config)
+    assert app.config['AHAB_PATH'] == config.AHAB_PATH
+    assert app.config['ALLOWED_COMMANDS'] is config.ALLOWED_COMMANDS
+    assert 'SETTINGS' not in app.config
+
+
+def test_config_as_mapping():
+    """Test that as_mapping exposes every setting read-only."""
+    config = Config()
+    mapping = config.as_mapping()
+    assert mapping is config.as_mapping()
+    assert set(mapping) == set(Config._SETTINGS)
+    assert mapping['WUI_PORT'] == config.WUI_PORT
+    with pytest.raises(TypeError):
+        mapping['WUI_PORT'] = 1
@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from commands.executor import CommandExecutor, ExecutionResult, get_system_status
+from commands.executor import CommandExecutor, ExecutionResult, OutputBatcher, get_system_status
 
 
 def test_executor_initialization():
@@ -46,7 +46,7 @@ def test_get_running_commands():
     if ahab_path.exists():
         executor = CommandExecutor(str(ahab_path))
         # No commands should be running initially
-        assert executor.get_running_commands() == []
+        assert executor.get_running_commands() == ()
 
 
 def test_strip_ansi_codes():
@@ -74,6 +74,7 @@ def test_get_system_status():
         assert 'workstation_running' in status
         assert 'services' in status
         assert 'last_updated' in status
+        assert isinstance(status['last_updated'], str)
         assert isinstance(status['workstation_installed'], bool)
         assert isinstance(status['workstation_running'], bool)
         assert isinstance(status['services'], list)
@@ -94,3 +95,199 @@ def test_execution_result_dataclass():
     assert result.exit_code == 0
     assert result.success is True
     assert result.duration == 1.5
+
+
+def test_output_batcher_flushes_full_batches():
+    """Test that the batcher delivers lines in max_lines batches."""
+    batches = []
+    batcher = OutputBatcher(batches.append, max_lines=3, interval=60)
+    for i in range(7):
+        batcher.add(f'line {i}')
+    assert batches == [['line 0', 'line 1', 'line 2'], ['line 3', 'line 4', 'line 5']]
+    batcher.flush()
+    assert batches[-1] == ['line 6']
+
+
+def test_execute_batch_callback_delivers_idle_tail(temp_ahab_dir):
+    """Test that a batch is delivered while the command goes quiet."""
+    import time
+    (temp_ahab_dir / 'Makefile').write_text(
+        'pause:\n\t@echo first\n\t@sleep 2\n\t@echo second\n'
+    )
+    batches = []
+    start = time.monotonic()
+    executor = CommandExecutor(str(temp_ahab_dir))
+    result = executor.execute(
+        'pause', batch_callback=lambda lines: batches.append((time.monotonic() - start, lines)))
+    assert result.success
+    assert [lines for _, lines in batches] == [['first'], ['second']]
+    assert batches[0][0] < 1
+
+
+def test_execute_batch_callback(ahab_path):
+    """Test that execute streams output through the batch callback."""
+    batches = []
+    executor = CommandExecutor(str(ahab_path))
+    result = executor.execute('help', batch_callback=batches.append)
+    assert result.success
+    assert [line for batch in batches for line in batch] == result.output.splitlines()
+
+
+def test_execute_captures_output(ahab_path):
+    """Test that execute captures output and streams each line."""
+    lines = []
+    executor = CommandExecutor(str(ahab_path))
+    result = executor.execute('test', callback=lines.append)
+    assert result.exit_code == 0
+    assert result.output == 'Running tests\n'
+    assert lines == ['Running tests']
+
+
+def test_get_system_status_cached(temp_ahab_dir, monkeypatch):
+    """Test that repeated status calls reuse one make status run."""
+    from commands import executor as executor_module
+    calls = []
+    
+    def fake_probe(path):
+        calls.append(path)
+        return {'workstation_installed': False, 'workstation_running': False,
+                'services': [], 'last_updated': 'now'}
+    
+    monkeypatch.setattr(executor_module, '_probe_system_status', fake_probe)
+    first = get_system_status(str(temp_ahab_dir))
+    first['command_running'] = True
+    second = get_system_status(str(temp_ahab_dir))
+    assert len(calls) == 1
+    assert 'command_running' not in second
+
+
+def test_strip_ansi_codes_bytes():
+    """Test stripping ANSI color codes from raw output bytes."""
+    raw = b'\x1b[1;31mError\x1b[0m: failed\n'
+    assert CommandExecutor.strip_ansi_codes(raw) == b'Error: failed\n'
+
+
+def test_strip_ansi_codes_plain_text():
+    """Test that text without escapes is returned unchanged."""
+    assert CommandExecutor.strip_ansi_codes('plain line') == 'plain line'
+    assert CommandExecutor.strip_ansi_codes(b'plain line') == b'plain line'
+    assert CommandExecutor.strip_ansi_codes('lone \x1b escape') == 'lone \x1b escape'
+
+
+def test_execute_without_callbacks(ahab_path):
+    """Test that output is captured when nothing is streaming."""
+    executor = CommandExecutor(str(ahab_path))
+    result = executor.execute('help')
+    assert result.output == 'Test Makefile\n'
+
+
+def test_execute_streams_lines_across_reads(temp_ahab_dir, monkeypatch):
+    """Test that lines split across pipe reads are reassembled."""
+    from commands import executor as executor_module
+    monkeypatch.setattr(executor_module, 'READ_CHUNK_SIZE', 4)
+    (temp_ahab_dir / 'Makefile').write_text(
+        'chatty:\n\t@printf "first line\\nsecond\\nno newline"\n'
+    )
+    lines = []
+    executor = CommandExecutor(str(temp_ahab_dir))
+    result = executor.execute('chatty', callback=lines.append)
+    assert lines == ['first line', 'second', 'no newline']
+    assert result.output == 'first line\nsecond\nno newline'
+
+
+def test_running_state_during_execute(ahab_path):
+    """Test that a command is reported as running only while it executes."""
+    executor = CommandExecutor(str(ahab_path))
+    seen = []
+    executor.execute('test', callback=lambda line: seen.append(
+        (executor.is_running('test'), executor.get_running_commands())))
+    assert seen == [(True, ('test',))]
+    assert not executor.is_running('test')
+    assert executor.get_running_commands() == ()
+
+
+def test_get_system_status_refreshes_in_background(temp_ahab_dir, monkeypatch):
+    """Test that a stale status is served while it is re-probed."""
+    import threading
+    from commands import executor as executor_module
+    probed = threading.Event()
+    calls = []
+    
+    def fake_probe(path):
+        calls.append(path)
+        if len(calls) > 1:
+            probed.set()
+        return {'workstation_installed': False, 'workstation_running': False,
+                'services': [], 'last_updated': f'probe {len(calls)}'}
+    
+    monkeypatch.setattr(executor_module, '_probe_system_status', fake_probe)
+    monkeypatch.setattr(executor_module, 'STATUS_CACHE_TTL', 0)
+    assert get_system_status(str(temp_ahab_dir))['last_updated'] == 'probe 1'
+    # Expired entry is still served; the refresh happens off-thread
+    assert get_system_status(str(temp_ahab_dir))['last_updated'] == 'probe 1'
+    assert probed.wait(timeout=5)
+
+
+def test_execute_rejects_duplicate_command(ahab_path):
+    """Test that a command cannot be started while it is running."""
+    executor = CommandExecutor(str(ahab_path))
+    errors = []
+    
+    def start_again(line):
+        with pytest.raises(ValueError, match="already running") as exc_info:
+            executor.execute('test')
+        errors.append(exc_info.value)
+    
+    executor.execute('test', callback=start_again)
+    assert len(errors) == 1
+    assert executor.get_running_commands() == ()
+
+
+def test_parse_running_services():
+    """Test extracting running ahab containers from make status output."""
+    from commands.executor import parse_running_services
+    output = (
+        "✓ Workstation: Running\n"
+        "ahab_apache   Up 2 hours   0.0.0.0:80->80/tcp\n"
+        "ahab_mysql    Exited (1) 5 minutes ago\n"
+        "other_php     Up 3 hours\n"
+        "  ahab_php    Up 10 minutes\n"
+    )
+    assert parse_running_services(output) == [
+        {'name': 'apache', 'status': 'running', 'container': 'ahab_apache'},
+        {'name': 'php', 'status': 'running', 'container': 'ahab_php'},
+    ]
+
+
+def test_parse_workstation_state():
+    """Test reading the workstation state from make status output."""
+    from commands.executor import parse_workstation_state
+    assert parse_workstation_state('✓ Workstation: Running\n') == (True, True)
+    assert parse_workstation_state('⚠ Workstation: Stopped\n') == (True, False)
+    assert parse_workstation_state('○ Workstation: Not Created\n') == (False, False)
+    assert parse_workstation_state('make: *** No rule to make target') is None
+
+
+def test_execute_translates_carriage_returns(temp_ahab_dir):
+    """Test that CRLF endings and bare CR progress updates end lines."""
+    (temp_ahab_dir / 'Makefile').write_text(
+        'crlf:\n\t@printf "dos line\\r\\n10%%\\r50%%\\r100%%\\ndone"\n'
+    )
+    lines = []
+    executor = CommandExecutor(str(temp_ahab_dir))
+    result = executor.execute('crlf', callback=lines.append)
+    assert lines == ['dos line', '10%', '50%', '100%', 'done']
+    assert result.output == 'dos line\n10%\n50%\n100%\ndone'
+
+
+def test_executor_without_make_on_path(ahab_path, monkeypatch):
+    """Test that a missing make only fails when a command runs."""
+    import shutil
+    monkeypatch.setattr(shutil, 'which', lambda name: None)
+    executor = CommandExecutor(str(ahab_path))
+    assert not executor.is_running('test')
+    
+    monkeypatch.setenv('PATH', '')
+    with pytest.raises(FileNotFoundError):
+        executor.execute('test')
+    assert not executor.is_running('test')
@@ -0,0 +1,178 @@
+"""Tests for the zero trust command executor."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from commands.zero_trust_executor import ZeroTrustCommandExecutor
+
+
+# Targets used by these tests; recipes run through make like real ones
+MAKEFILE = """
+.PHONY: streams crlf slow pause
+streams:
+\t@echo out
+\t@echo err >&2
+crlf:
+\t@printf "dos line\\r\\n10%%\\r100%%\\n"
+\t@printf "err\\r\\n" >&2
+slow:
+\t@echo started
+\t@sleep 3
+pause:
+\t@echo first
+\t@sleep 2
+\t@echo second
+"""
+
+
+@pytest.fixture
+def zt_ahab_dir(temp_ahab_dir):
+    """Temporary ahab directory with the zero trust test targets."""
+    (temp_ahab_dir / 'Makefile').write_text(MAKEFILE)
+    return temp_ahab_dir
+
+
+def _start_slow(executor, results):
+    """Run the slow target in a thread; returns once make is running."""
+    started = threading.Event()
+    thread = threading.Thread(target=lambda: results.append(
+        executor.execute('slow', callback=lambda line: started.set())))
+    thread.start()
+    assert started.wait(5), "slow target never produced output"
+    return thread
+
+
+def test_stderr_merged_into_output(zt_ahab_dir):
+    """Test that stderr is part of the output stream by default."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    result = executor.execute('streams')
+    assert result.is_completely_successful()
+    assert result.output == 'out\nerr\n'
+    assert result.error_output == ''
+
+
+def test_stderr_captured_separately(zt_ahab_dir):
+    """Test that stderr goes to error_output when not merged."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir), merge_stderr=False)
+    lines = []
+    result = executor.execute('streams', callback=lines.append)
+    assert result.output == 'out\n'
+    assert result.error_output == 'err\n'
+    assert lines == ['out']
+
+    result = executor.execute('streams')
+    assert result.output == 'out\n'
+    assert result.error_output == 'err\n'
+
+
+def test_carriage_returns_translated(zt_ahab_dir):
+    """Test that CRLF and bare CR end lines, as in text mode."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir), merge_stderr=False)
+    lines = []
+    result = executor.execute('crlf', callback=lines.append)
+    assert lines == ['dos line', '10%', '100%']
+    assert result.output == 'dos line\n10%\n100%\n'
+    assert result.error_output == 'err\n'
+
+
+def test_batch_callback_delivers_idle_tail(zt_ahab_dir):
+    """Test that batches arrive while the command goes quiet."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    batches = []
+    start = time.monotonic()
+    result = executor.execute(
+        'pause', batch_callback=lambda lines: batches.append((time.monotonic() - start, lines)))
+    assert result.is_completely_successful()
+    assert [lines for _, lines in batches] == [['first'], ['second']]
+    assert batches[0][0] < 1
+    assert result.output == 'first\nsecond\n'
+
+
+def test_timeout_without_callback(zt_ahab_dir):
+    """Test that a command without streaming is stopped at its timeout."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    result = executor.execute('slow', timeout_override=1)
+    assert result.timeout_occurred
+    assert result.exit_code == 124
+    assert result.duration < 3
+    assert result.output == 'started\n'
+    assert not executor.is_running('slow')
+
+
+def test_timeout_with_callback(zt_ahab_dir):
+    """Test that a streaming command is stopped at its timeout."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    lines = []
+    result = executor.execute('slow', callback=lines.append, timeout_override=1)
+    assert result.timeout_occurred
+    assert result.exit_code == 124
+    assert result.duration < 3
+    assert lines == ['started']
+    assert result.output == 'started\n'
+
+
+def test_duplicate_execution_rejected(zt_ahab_dir):
+    """Test that a command cannot run twice at once."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    results = []
+    thread = _start_slow(executor, results)
+    try:
+        assert executor.is_running('slow')
+        assert executor.get_running_commands() == ['slow']
+        with pytest.raises(ValueError, match="already running"):
+            executor.execute('slow')
+    finally:
+        executor.kill('slow')
+        thread.join()
+
+
+def test_kill_running_command(zt_ahab_dir):
+    """Test that kill stops a running command and forgets it."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    results = []
+    thread = _start_slow(executor, results)
+
+    assert executor.kill('slow')
+    thread.join(5)
+    assert not thread.is_alive()
+    assert not executor.is_running('slow')
+    assert not executor.kill('slow')
+
+    result = results[0]
+    assert not result.success
+    assert result.has_critical_failure()
+
+
+def test_execution_history_timestamps(zt_ahab_dir):
+    """Test that history records carry ISO 8601 timestamps."""
+    executor = ZeroTrustCommandExecutor(str(zt_ahab_dir))
+    result = executor.execute('streams')
+
+    history = executor.get_execution_history()
+    assert len(history) == 1
+    assert history[0]['command'] == 'streams'
+    assert history[0]['timestamp'] == result.timestamp.isoformat()
+    assert isinstance(datetime.fromisoformat(history[0]['timestamp']), datetime)
+
+
+def test_concurrent_system_status_share_one_run(temp_ahab_dir):
+    """Test that overlapping status checks wait for the same make run."""
+    from commands.zero_trust_executor import get_system_status
+    (temp_ahab_dir / 'Makefile').write_text(
+        'status:\n\t@sleep 1\n\t@echo "Workstation: Running"\n\t@echo "Status Check Complete"\n'
+    )
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_system_status(str(temp_ahab_dir))))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.2)
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 2
+    for status in results:
+        assert status['errors'] == []
+        assert status['workstation_running']